@@ -2,6 +2,8 @@ from flask import Flask, redirect, url_for
 from flask_sqlalchemy import SQLAlchemy  # type: ignore
 from flask_migrate import Migrate  # type: ignore
 from flask_login import LoginManager  # type: ignore
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import configure_mappers
 from config import config
 
 # Initialize extensions
@@ -9,15 +11,23 @@ db = SQLAlchemy()
 migrate = Migrate()
 login_manager = LoginManager()  # Add this line
 
+
+class _App(Flask):
+    """Flask app whose Jinja environment comes with min/max as globals"""
+
+    def create_jinja_environment(self):
+        env = super().create_jinja_environment()
+        env.globals['min'] = min
+        env.globals['max'] = max
+        return env
+
+
 def create_app(config_name='default'):
     """Application factory pattern"""
-    app = Flask(__name__)
+    app = _App(__name__)
     
     # Load configuration
     app.config.from_object(config[config_name])
-
-    # Add min/max to Jinja2 globals
-    app.jinja_env.globals.update(min=min, max=max)
     
     # Initialize extensions with app
     db.init_app(app)
@@ -63,4 +73,14 @@ def create_app(config_name='default'):
     def index():
         return redirect(url_for('dashboard.home'))
 
+    # Compile mappers and open the first pooled connection at boot so the
+    # first request doesn't pay for them
+    if not app.config.get('TESTING'):
+        configure_mappers()
+        with app.app_context():
+            try:
+                db.engine.connect().close()
+            except OperationalError as e:
+                app.logger.warning(f"Database not reachable at startup: {e}")
+
     return app
\ No newline at end of file
@@ -5,12 +5,36 @@ Similar to IDE code highlighting
 """
 
 import re
+from functools import lru_cache
 from html import escape
 
 
+# Escaped form of every ASCII character html.escape rewrites; built once at
+# import so single characters can be escaped with a table lookup
+_ESC = [None] * 128
+_ESC[ord('&')] = '&amp;'
+_ESC[ord('<')] = '&lt;'
+_ESC[ord('>')] = '&gt;'
+_ESC[ord('"')] = '&quot;'
+_ESC[ord("'")] = '&#x27;'
+
+
+def _esc1(char):
+    """Escape a single character using the precomputed table."""
+    o = ord(char)
+    if o < 128 and _ESC[o]:
+        return _ESC[o]
+    return char
+
+
+@lru_cache(maxsize=4096)
 def highlight_cie_syntax(cie_body):
     """
     Convert CIE body text to HTML with syntax highlighting.
+
+    Output depends only on the input text, so results are memoized; the same
+    stored event is re-rendered on every detail/list view. Call
+    highlight_cie_syntax.cache_clear() if the span class names change.
     
     Args:
         cie_body (str): Plain text CIE body
@@ -22,11 +46,11 @@ def highlight_cie_syntax(cie_body):
         return ""
     
     lines = cie_body.split('\n')
-    highlighted_lines = []
+    # Sized up front; blank lines keep the '' placeholder
+    highlighted_lines = [''] * len(lines)
     
-    for line in lines:
+    for n, line in enumerate(lines):
         if not line.strip():
-            highlighted_lines.append('')
             continue
             
         # Preserve leading whitespace (indentation)
@@ -38,11 +62,123 @@ def highlight_cie_syntax(cie_body):
         highlighted = highlight_line(content)
         
         # Reconstruct with preserved indentation
-        highlighted_lines.append(leading_spaces + highlighted)
+        highlighted_lines[n] = leading_spaces + highlighted
     
     return '\n'.join(highlighted_lines)
 
 
+# Single-pass tokenizer for a CIE line. Alternatives are tried in order at
+# each position, mirroring the precedence of the original character loop:
+# - text: run of characters that start no other token (whitespace,
+#   punctuation); listed first as it is the most common match
+# - symbol/bullet/loc: single marker characters
+# - action/bracket: {...} or [...] up to the first closing character
+# - relop: <> before single < or >
+# - op: / and \\
+# - xop: x or X standing alone between whitespace (or line boundaries)
+# - entity: alphanumeric run that may contain dots and hyphens
+# - char: fallback for an unclosed { or [
+_TOKEN_RE = re.compile(
+    r'(?P<text>(?:[^\w$▪{\[<>/\\@]|_)+)'
+    r'|(?P<xop>(?<!\S)[xX](?!\S))'
+    r'|(?P<entity>[^\W_](?:[^\W_]|[.\-])*)'
+    r'|(?P<symbol>\$)'
+    r'|(?P<bullet>▪)'
+    r'|(?P<action>\{[^}]*\})'
+    r'|(?P<bracket>\[[^\]]*\])'
+    r'|(?P<relop><>|[<>])'
+    r'|(?P<op>[/\\])'
+    r'|(?P<loc>@)'
+    r'|(?P<char>.)',
+    re.DOTALL
+)
+
+
+# Any character that can start a highlighted token. A line without one is a
+# single text run (whitespace/punctuation only) and is just escaped.
+_TRIGGERS_RE = re.compile(r'[\w$▪{\[<>/\\@]')
+
+
+def _escape_text(token):
+    return _esc1(token) if len(token) == 1 else escape(token)
+
+
+# Span markup, built once. Tokens from the single-character groups have a
+# fixed set of values, so their full tagged strings are precomputed too.
+_SPAN_S = '</span>'
+_ACT_P = '<span class="cf-action">'
+_BR_P = '<span class="cf-bracket">'
+_ENT_P = '<span class="cf-entity">'
+_COUNTRY_P = '<span class="cf-country">'
+_SYM_FULL = '<span class="cf-symbol">$</span>'
+_BULL_FULL = '<span class="cf-bullet">▪</span>'
+_LOC_FULL = '<span class="cf-location-op">@</span>'
+_REL_FULL = {
+    '<>': '<span class="cf-relation-op">&lt;&gt;</span>',
+    '<': '<span class="cf-relation-op">&lt;</span>',
+    '>': '<span class="cf-relation-op">&gt;</span>',
+}
+_OP_FULL = {
+    op: '<span class="cf-operator">' + op + _SPAN_S
+    for op in ('/', '\\', 'x', 'X')
+}
+
+# Renderer for each tokenizer group, keyed by group name
+_RENDERERS = {
+    'symbol': lambda token: _SYM_FULL,
+    'bullet': lambda token: _BULL_FULL,
+    'action': lambda token: _ACT_P + escape(token) + _SPAN_S,
+    'bracket': lambda token: _BR_P + escape(token) + _SPAN_S,
+    'relop': _REL_FULL.__getitem__,
+    'op': _OP_FULL.__getitem__,
+    'xop': _OP_FULL.__getitem__,
+    'entity': lambda token: _entity_html(token),
+    'loc': lambda token: _LOC_FULL,
+    'text': _escape_text,
+    'char': _escape_text,
+}
+
+
+def _replace_token(match, _renderers=_RENDERERS):
+    """Render one tokenizer match as highlighted HTML."""
+    return _renderers[match.lastgroup](match.group())
+
+
+def _entity_html(token):
+    """
+    Render an alphanumeric token matched by the tokenizer.
+
+    Numeric characters that are neither letters nor digits (e.g. ½) never
+    start an entity; they are emitted as plain text and the entity starts
+    at the first letter or digit after them.
+    """
+    first = token[0]
+    if first.isalpha() or first.isdigit():
+        return _classify_token(token)
+
+    i = 0
+    while i < len(token) and not (token[i].isalpha() or token[i].isdigit()):
+        i += 1
+    return token[:i] + (_classify_token(token[i:]) if i < len(token) else '')
+
+
+def _classify_token(token_str):
+    """Wrap an entity code or 3-letter country code; leave other words plain."""
+    # Tokens are made of alphanumerics, dots and hyphens only, so there is
+    # nothing in them for html.escape to rewrite
+    # Check if it's an entity code (has at least one dot)
+    if '.' in token_str:
+        parts = token_str.split('.')
+        if len(parts) >= 2 and all(part.isalnum() for part in parts):
+            return _ENT_P + token_str + _SPAN_S
+        return token_str
+    # Check if it's a 3-letter code (country code or institution)
+    elif len(token_str) == 3 and token_str.isalpha() and token_str.islower():
+        return _COUNTRY_P + token_str + _SPAN_S
+    # Plain text/word
+    return token_str
+
+
 def highlight_line(line):
     """
     Apply syntax highlighting to a single line of CIE.
@@ -53,118 +189,14 @@ def highlight_line(line):
     - Entity codes (xxx.yyy.zzz or xxx.yyy): pink (cf-entity)
     - Action codes {xxx}: yellow (cf-action)
     - Brackets []: yellow (cf-bracket)
-    - Operators (/, x, \): cyan (cf-operator)
+    - Operators (/, x, \\): cyan (cf-operator)
     - Relation operators (<>, >, <): green (cf-relation-op)
     - Parentheses (): white/default
     - Plain text: default
     """
-    result = []
-    i = 0
-    
-    while i < len(line):
-        char = line[i]
-        
-        # Dollar sign
-        if char == '$':
-            result.append('<span class="cf-symbol">$</span>')
-            i += 1
-        
-        # Bullet
-        elif char == '▪':
-            result.append('<span class="cf-bullet">▪</span>')
-            i += 1
-        
-        # Action codes or brackets
-        elif char == '{' or char == '[':
-            # Find closing bracket
-            close_char = '}' if char == '{' else ']'
-            end = line.find(close_char, i)
-            
-            if end != -1:
-                content = line[i:end+1]
-                if char == '{':
-                    result.append(f'<span class="cf-action">{escape(content)}</span>')
-                else:
-                    result.append(f'<span class="cf-bracket">{escape(content)}</span>')
-                i = end + 1
-            else:
-                result.append(escape(char))
-                i += 1
-        
-        # Operators
-        elif char in ['/', '\\', 'x', 'X']:
-            # Check if 'x' is part of a word or standalone operator
-            if char in ['x', 'X']:
-                # Check context - if surrounded by spaces or at boundaries, it's an operator
-                prev_space = i == 0 or line[i-1].isspace()
-                next_space = i == len(line)-1 or line[i+1].isspace()
-                
-                if prev_space and next_space:
-                    result.append(f'<span class="cf-operator">{char}</span>')
-                    i += 1
-                else:
-                    # Part of a word, continue to entity/text handling
-                    i = handle_entity_or_text(line, i, result)
-            else:
-                result.append(f'<span class="cf-operator">{char}</span>')
-                i += 1
-        
-        # Relation operators
-        elif char in ['<', '>']:
-            # Check for <> or standalone < >
-            if char == '<' and i+1 < len(line) and line[i+1] == '>':
-                result.append('<span class="cf-relation-op">&lt;&gt;</span>')
-                i += 2
-            else:
-                result.append(f'<span class="cf-relation-op">{escape(char)}</span>')
-                i += 1
-        
-        # Entity codes (xxx.yyy.zzz or xxx.yyy)
-        elif char.isalpha() or char.isdigit():
-            i = handle_entity_or_text(line, i, result)
-
-        elif char == '@':
-            result.append('<span class="cf-location-op">@</span>')
-            i += 1
-                
-        # Whitespace and other characters
-        else:
-            result.append(escape(char))
-            i += 1
-    
-    return ''.join(result)
-
-
-def handle_entity_or_text(line, start, result):
-    """
-    Handle entity codes (xxx.yyy.zzz) or plain text.
-    Returns the new index position.
-    """
-    i = start
-    token = []
-    
-    # Collect alphanumeric characters and dots
-    while i < len(line) and (line[i].isalnum() or line[i] in ['.', '-']):
-        token.append(line[i])
-        i += 1
-    
-    token_str = ''.join(token)
-    
-    # Check if it's an entity code (has at least one dot)
-    if '.' in token_str:
-        parts = token_str.split('.')
-        if len(parts) >= 2 and all(part.isalnum() for part in parts):
-            result.append(f'<span class="cf-entity">{escape(token_str)}</span>')
-        else:
-            result.append(escape(token_str))
-    # Check if it's a 3-letter code (country code or institution)
-    elif len(token_str) == 3 and token_str.isalpha() and token_str.islower():
-        result.append(f'<span class="cf-country">{escape(token_str)}</span>')
-    else:
-        # Plain text/word
-        result.append(escape(token_str))
-        
-    return i
+    if not _TRIGGERS_RE.search(line):
+        return escape(line)
+    return _TOKEN_RE.sub(_replace_token, line)
 
 
 # Example usage and test
@@ -1,9 +1,54 @@
 from flask_wtf import FlaskForm # type:ignore
 from wtforms import StringField, TextAreaField, DateField, SelectField, IntegerField # type:ignore
-from wtforms.validators import DataRequired, Length, Optional, ValidationError # type:ignore
+from wtforms.validators import DataRequired, Length, Optional, ValidationError, Regexp # type:ignore
 from datetime import date
+from flask import g
 from app.models import Institution, Position, Actor, Tenure
 from app import db
+from app.forms.event_forms import current_date
+
+
+def _request_cached(key, build):
+    """Build a choice list once per request and reuse it for every form"""
+    if key not in g:
+        setattr(g, key, build())
+    return getattr(g, key)
+
+
+def institution_choices():
+    """(code, label) pairs for institution pickers, from one column query"""
+    def build():
+        rows = db.session.execute(
+            db.select(Institution.institution_code, Institution.institution_name)
+            .order_by(Institution.institution_name)
+        ).all()
+        return [(code, f'{code} - {name}') for code, name in rows]
+    return _request_cached('institution_choices', build)
+
+
+def actor_choices():
+    """(actor_id, label) pairs for actor pickers, from one column query"""
+    def build():
+        rows = db.session.execute(
+            db.select(Actor.actor_id, Actor.surname, Actor.given_name, Actor.middle_name)
+            .order_by(Actor.surname, Actor.given_name)
+        ).all()
+        return [
+            (actor_id, f'{actor_id} - {Actor.format_display_name(surname, given_name, middle_name)}')
+            for actor_id, surname, given_name, middle_name in rows
+        ]
+    return _request_cached('actor_choices', build)
+
+
+def position_choices():
+    """(position_code, label) pairs for position pickers, from one column query"""
+    def build():
+        rows = db.session.execute(
+            db.select(Position.position_code, Position.position_title)
+            .order_by(Position.position_title)
+        ).all()
+        return [(code, f'{code} - {title}') for code, title in rows]
+    return _request_cached('position_choices', build)
 
 
 class InstitutionForm(FlaskForm):
@@ -61,6 +106,10 @@ class PositionForm(FlaskForm):
                                validators=[Optional()],
                                description='Additional context')
     
+    def populate_choices(self):
+        """Fill the institution picker"""
+        self.institution_code.choices = institution_choices()
+    
     def validate_position_code(self, field):
         """Check if position code already exists (only for new positions)"""
         if not hasattr(self, 'edit_mode') or not self.edit_mode:
@@ -74,7 +123,11 @@ class ActorForm(FlaskForm):
     
     # For new actors, these fields generate the actor_id
     country_code = StringField('Country Code',
-                              validators=[DataRequired(), Length(min=3, max=3)],
+                              validators=[
+                                  DataRequired(),
+                                  Length(min=3, max=3),
+                                  Regexp(r'^[a-z]{3}$', message='Country code must be 3 lowercase letters')
+                              ],
                               description='ISO 3-letter country code (e.g., usa, gbr, jpn)')
     
     birth_year = IntegerField('Birth Year',
@@ -99,14 +152,9 @@ class ActorForm(FlaskForm):
     
     def validate_birth_year(self, field):
         """Ensure birth year is reasonable"""
-        current_year = date.today().year
+        current_year = current_date().year
         if field.data < 1900 or field.data > current_year:
             raise ValidationError(f'Birth year must be between 1900 and {current_year}')
-    
-    def validate_country_code(self, field):
-        """Ensure country code is lowercase"""
-        if field.data != field.data.lower():
-            raise ValidationError('Country code must be lowercase')
 
 
 class ActorEditForm(FlaskForm):
@@ -150,6 +198,12 @@ class TenureForm(FlaskForm):
                           validators=[Optional()],
                           description='Date tenure ended (leave blank if current)')
     
+    def populate_choices(self, include_positions=True):
+        """Fill the actor picker and, unless the position is fixed, the position picker"""
+        self.actor_id.choices = actor_choices()
+        if include_positions:
+            self.position_code.choices = position_choices()
+    
     def validate_tenure_end(self, field):
         """Ensure end date is after start date"""
         if field.data and self.tenure_start.data:
@@ -161,21 +215,22 @@ class TenureForm(FlaskForm):
         if not super().validate(extra_validators):
             return False
         
-        # Check for overlapping tenures
-        overlapping = Tenure.query.filter(
+        # Check for overlapping tenures. An open tenure ends on 9999-12-31,
+        # matching the expression in ix_tenure_overlap so the check is a
+        # single index probe
+        overlapping = db.session.query(Tenure.tenure_id).filter(
             Tenure.position_code == self.position_code.data,
             Tenure.tenure_start <= (self.tenure_end.data or date(9999, 12, 31)),
-            db.or_(
-                Tenure.tenure_end.is_(None),
-                Tenure.tenure_end >= self.tenure_start.data
-            )
+            db.func.coalesce(
+                Tenure.tenure_end, db.literal_column("'9999-12-31'::date")
+            ) >= self.tenure_start.data
         )
         
         # Exclude current tenure if editing
         if hasattr(self, 'tenure_id') and self.tenure_id:
             overlapping = overlapping.filter(Tenure.tenure_id != self.tenure_id)
         
-        if overlapping.first():
+        if db.session.query(overlapping.exists()).scalar():
             self.tenure_start.errors.append('This position is already occupied during this time period')
             return False
         
@@ -185,6 +240,11 @@ class TenureForm(FlaskForm):
 class ArticleSearchForm(FlaskForm):
     """Form for searching/filtering articles"""
     
+    class Meta:
+        # Bound to request.args on GET list pages; there is nothing to
+        # protect, so skip generating a CSRF token on every render
+        csrf = False
+    
     date_from = DateField('Published From', validators=[Optional()])
     date_to = DateField('Published To', validators=[Optional()])
     
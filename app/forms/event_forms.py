@@ -2,17 +2,87 @@ from flask_wtf import FlaskForm # type: ignore
 from wtforms import StringField, TextAreaField, DateField, SelectField, SelectMultipleField, HiddenField # type:ignore
 from wtforms.validators import DataRequired, Length, Optional, ValidationError, Regexp # type: ignore
 from datetime import date
+from functools import lru_cache
 from app.reference_data import COUNTRY_REGIONS
 from app.reference_data import REGION_NAMES
-import re
+from app.models import ActionCode
+from app import db
+import time
 
-REGION_CHOICES = [
+REGION_CHOICES = tuple(
     (code.lower(), name) 
     for code, name in sorted(REGION_NAMES.items(), key=lambda x: x[1])
-]
+)
 
 # For search forms that need an "All" option
-REGION_CHOICES_WITH_ALL = [('', 'All Regions')] + REGION_CHOICES
+REGION_CHOICES_WITH_ALL = (('', 'All Regions'),) + REGION_CHOICES
+
+# Region codes accepted in event codes, for O(1) membership checks
+VALID_REGION_CODES = frozenset(code for code, _ in REGION_CHOICES)
+
+
+def _is_code_letters(segment):
+    """Lowercase ASCII letters only (the [a-z]+ of a code segment)"""
+    return segment.isascii() and segment.isalpha() and segment.islower()
+
+
+def _is_position_code(parts):
+    """Position code split on '.', e.g. rus.hos.spx or rus.hos.spx.01"""
+    if len(parts) < 2 or len(parts[0]) != 3 or not _is_code_letters(parts[0]):
+        return False
+    segments = parts[1:]
+    # Optional 2-digit suffix after at least one letter segment
+    if len(segments) > 1 and len(segments[-1]) == 2 and segments[-1].isdecimal():
+        segments = segments[:-1]
+    return all(3 <= len(seg) <= 4 and _is_code_letters(seg) for seg in segments)
+
+
+def _is_actor_code(parts):
+    """Actor code split on '.', e.g. usa.2024.001"""
+    return (len(parts) == 3
+            and len(parts[0]) == 3 and _is_code_letters(parts[0])
+            and len(parts[1]) == 4 and parts[1].isdecimal()
+            and len(parts[2]) == 3 and parts[2].isdecimal())
+
+
+@lru_cache(maxsize=1)
+def _today_for_minute(epoch_minute):
+    return date.today()
+
+
+def current_date():
+    """Today's date, re-read from the clock at most once a minute"""
+    return _today_for_minute(int(time.time()) // 60)
+
+
+@lru_cache(maxsize=1)
+def _action_code_choices_for_minute(epoch_minute):
+    rows = db.session.execute(
+        db.select(ActionCode.action_code, ActionCode.action_type, ActionCode.action_category)
+        .order_by(ActionCode.action_category, ActionCode.action_code)
+    ).all()
+    
+    # Group action codes by category for better UX
+    grouped_choices = []
+    current_category = None
+    for code, action_type, category in rows:
+        if category != current_category:
+            if current_category is not None:
+                grouped_choices.append(('---', '---'))  # Separator
+            current_category = category
+        grouped_choices.append((code, f"{code} - {action_type}"))
+    return tuple(grouped_choices)
+
+
+def action_code_choices():
+    """
+    Grouped (code, label) pairs for the action code picker.
+    
+    The taxonomy is only changed by the import scripts, so each worker keeps
+    one copy and re-reads it from the database at most once a minute.
+    """
+    return _action_code_choices_for_minute(int(time.time()) // 60)
+
 
 class EventCFCreationForm(FlaskForm):
     """Control Frame form for creating CIE-coded events with parser integration"""
@@ -24,6 +94,7 @@ class EventCFCreationForm(FlaskForm):
     
     region = SelectField('Region',
                         choices=REGION_CHOICES,
+                        validate_choice=False,  # checked against VALID_REGION_CODES in validate_region
                         validators=[DataRequired()],
                         description='Geographic region (3-letter code)')
     
@@ -42,10 +113,7 @@ class EventCFCreationForm(FlaskForm):
                              description='Auto-populated from action code')
     
     rel_cred = StringField('Reliability/Credibility',
-                          validators=[
-                              DataRequired(),
-                              Regexp(r'^[1-6]-[A-F]$', message='Format must be: [1-6]-[A-F] (e.g., 1-A, 3-C)')
-                          ],
+                          validators=[DataRequired()],
                           description='Reliability (1-6) and Credibility (A-F), e.g., 1-A')
     
     # Source Article
@@ -74,27 +142,35 @@ class EventCFCreationForm(FlaskForm):
     
     def validate_event_date(self, field):
         """Ensure event date is not in the future"""
-        if field.data > date.today():
+        if field.data > current_date():
             raise ValidationError('Event date cannot be in the future')
     
+    def validate_region(self, field):
+        """Region must be one of the known region codes"""
+        if field.data not in VALID_REGION_CODES:
+            raise ValidationError('Not a valid choice.')
+    
+    def validate_rel_cred(self, field):
+        """Reliability 1-6, a hyphen, credibility A-F (fixed 3-char shape, no regex needed)"""
+        value = field.data
+        if (len(value) != 3 or value[1] != '-'
+                or not '1' <= value[0] <= '6' or not 'A' <= value[2] <= 'F'):
+            raise ValidationError('Format must be: [1-6]-[A-F] (e.g., 1-A, 3-C)')
+    
     def validate_event_actor(self, field):
         """Validate event actor code format - accepts both position codes and actor codes"""
-        value = field.data.lower()
-        
-        # Pattern 1: Position code (e.g., rus.hos.spx or rus.hos.spx.01)
-        position_pattern = r'^[a-z]{3}(\.[a-z]{3,4})+(\.\d{2})?$'
-        
-        # Pattern 2: Actor code (e.g., usa.2024.001)
-        actor_pattern = r'^([a-z]{3})\.(\d{4})\.(\d{3})$'
+        value = field.data
+        if not value.islower():
+            value = value.lower()
+        parts = value.split('.')
         
         # Check if it matches position pattern
-        if re.match(position_pattern, value):
+        if _is_position_code(parts):
             return  # Valid position code
         
         # Check if it matches actor pattern
-        actor_match = re.match(actor_pattern, value)
-        if actor_match:
-            country_code = actor_match.group(1)
+        if _is_actor_code(parts):
+            country_code = parts[0]
             # Validate that country code exists in reference data
             if country_code in COUNTRY_REGIONS:
                 return  # Valid actor code
@@ -120,7 +196,11 @@ class EventCreationForm(FlaskForm):
     
     # CIE coding fields
     core_action = StringField('Core Action',
-                             validators=[DataRequired(), Length(max=10)],
+                             validators=[
+                                 DataRequired(),
+                                 Length(max=10),
+                                 Regexp(r'^\[[a-z\-]{1,8}\]$', message='Format must be a bracketed action code (e.g., [s-tr], [sn])')
+                             ],
                              description='CIE action code (e.g., [s-tr], [sn])')
     
     cie_description = TextAreaField('CIE Description',
@@ -147,7 +227,7 @@ class EventCreationForm(FlaskForm):
     
     def validate_event_date(self, field):
         """Ensure event date is not in the future"""
-        if field.data > date.today():
+        if field.data > current_date():
             raise ValidationError('Event date cannot be in the future')
 
 
@@ -194,6 +274,11 @@ class EventEditForm(FlaskForm):
 class EventSearchForm(FlaskForm):
     """Form for searching/filtering events"""
     
+    class Meta:
+        # Bound to request.args on GET list pages; there is nothing to
+        # protect, so skip generating a CSRF token on every render
+        csrf = False
+    
     date_from = DateField('Date From', validators=[Optional()])
     date_to = DateField('Date To', validators=[Optional()])
     
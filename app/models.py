@@ -1,9 +1,11 @@
 from app import db
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, insert as pg_insert
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 from flask_login import UserMixin
 from datetime import datetime
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import event, DDL
 
 
 class Article(db.Model):
@@ -20,8 +22,39 @@ class Article(db.Model):
     is_processed = db.Column(db.Boolean, nullable=False, default=False)
     is_junk = db.Column(db.Boolean, nullable=False, default=False)
     
+    # Relationships
+    control_frames = db.relationship('ControlFrame', back_populates='source_article')
+    
+    __table_args__ = (
+        # Review queue and unprocessed badge only touch articles still awaiting review
+        db.Index('ix_articles_unprocessed', 'published_date',
+                 postgresql_where=db.text('is_processed = false AND is_junk = false')),
+    )
+    
     def __repr__(self):
         return f'<Article {self.article_id}: {self.headline[:50]}>'
+    
+    @classmethod
+    def bulk_load(cls, rows):
+        """
+        Insert collected articles, skipping any whose URL is already stored.
+        
+        Args:
+            rows: List of dicts of Article column values
+        
+        Returns:
+            Number of articles inserted
+        
+        Sent as multi-row INSERT ... ON CONFLICT (url) DO NOTHING, instead of
+        a lookup and an INSERT per article.
+        """
+        if not rows:
+            return 0
+        inserted = db.session.execute(
+            pg_insert(cls).on_conflict_do_nothing(index_elements=['url']).returning(cls.article_id),
+            rows
+        ).all()
+        return len(inserted)
 
 
 class ActionCode(db.Model):
@@ -33,6 +66,9 @@ class ActionCode(db.Model):
     action_category = db.Column(db.String(50))
     definition = db.Column(db.Text)
     
+    # Relationships
+    control_frames = db.relationship('ControlFrame', back_populates='action')
+    
     def __repr__(self):
         return f'<ActionCode {self.action_code}: {self.action_type}>'
 
@@ -51,29 +87,59 @@ class ControlFrame(db.Model):
 
     # CHANGED: Use JSONB for automatic list handling
     # No more manual comma-splitting needed
-    identified_subjects = db.Column(JSONB, default=list) 
-    identified_objects = db.Column(JSONB, default=list)
+    identified_subjects = db.Column(JSONB, nullable=False, default=list, server_default=db.text("'[]'::jsonb"))
+    identified_objects = db.Column(JSONB, nullable=False, default=list, server_default=db.text("'[]'::jsonb"))
     
     source_article_id = db.Column(db.Integer, db.ForeignKey('articles.article_id'))
     
     # CHANGED: Specifically use JSONB for better indexing/performance over standard JSON
-    parse_tree_cache = db.Column(JSONB) 
+    # Deferred: the tree runs to several KB and is TOASTed, and no page reads
+    # it back, so plain ControlFrame queries leave it out of the SELECT
+    parse_tree_cache = db.deferred(db.Column(JSONB))
     
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Lexemes of the body, actor and entity lists, kept up to date by
+    # PostgreSQL. Deferred: only the search filter reads it
+    search_vector = db.deferred(db.Column(
+        TSVECTOR,
+        db.Computed(
+            "to_tsvector('simple', coalesce(cie_body, '') || ' ' || coalesce(event_actor, '')"
+            " || ' ' || coalesce(identified_subjects::text, '')"
+            " || ' ' || coalesce(identified_objects::text, ''))",
+            persisted=True,
+        ),
+    ))
+    
     # Relationships
-    action = db.relationship('ActionCode', backref='control_frames')
-    source_article = db.relationship('Article', backref='control_frames')
+    action = db.relationship('ActionCode', back_populates='control_frames')
+    source_article = db.relationship('Article', back_populates='control_frames')
+    scenario_links = db.relationship('ScenarioEvent', back_populates='event')
+    
+    __table_args__ = (
+        # Serve the identified_subjects/objects @> [code] lookups in foundations
+        db.Index('ix_cf_subjects_gin', 'identified_subjects', postgresql_using='gin',
+                 postgresql_ops={'identified_subjects': 'jsonb_path_ops'}),
+        db.Index('ix_cf_objects_gin', 'identified_objects', postgresql_using='gin',
+                 postgresql_ops={'identified_objects': 'jsonb_path_ops'}),
+        # Serve the events list search_text filter
+        db.Index('ix_cf_search_gin', 'search_vector', postgresql_using='gin'),
+    )
     
     def __repr__(self):
         return f'<ControlFrame {self.event_code}: {self.action_code}>'
     
     # Simplified: JSONB returns a list automatically
     def get_subjects_list(self):
-        return self.identified_subjects or []
+        return self.identified_subjects
     
     def get_objects_list(self):
-        return self.identified_objects or []
+        return self.identified_objects
+    
+    @classmethod
+    def search_filter(cls, text):
+        """WHERE clause matching every word of text against search_vector"""
+        return cls.search_vector.op('@@')(db.func.plainto_tsquery('simple', text))
 
 class Institution(db.Model):
     """Organizational entities that contain positions"""
@@ -111,21 +177,26 @@ class Position(db.Model):
     institution = db.relationship('Institution', back_populates='positions')
     tenures = db.relationship('Tenure', back_populates='position', cascade='all, delete-orphan')
     reports_to = db.relationship('Position', remote_side=[position_code], backref='direct_reports', foreign_keys=[reports_to_position_code])
+    # Actor of the open tenure; list views eager-load it for every position at once
+    current_holder = db.relationship(
+        'Actor',
+        secondary='tenures',
+        primaryjoin='and_(Position.position_code == Tenure.position_code, Tenure.tenure_end.is_(None))',
+        secondaryjoin='Tenure.actor_id == Actor.actor_id',
+        uselist=False,
+        viewonly=True
+    )
     
     def __repr__(self):
         return f'<Position {self.position_code}: {self.position_title}>'
     
     def get_current_holder(self):
         """Get the actor currently holding this position"""
-        current_tenure = Tenure.query.filter_by(
-            position_code=self.position_code,
-            tenure_end=None
-        ).first()
-        return current_tenure.actor if current_tenure else None
+        return self.current_holder
     
     def get_holder_on_date(self, date):
         """Get the actor holding this position on a specific date"""
-        tenure = Tenure.query.filter(
+        tenure = Tenure.query.options(joinedload(Tenure.actor)).filter(
             Tenure.position_code == self.position_code,
             Tenure.tenure_start <= date,
             db.or_(Tenure.tenure_end.is_(None), Tenure.tenure_end >= date)
@@ -143,6 +214,14 @@ class Actor(db.Model):
     middle_name = db.Column(db.String(150))
     birth_year = db.Column(db.Integer)
     
+    __table_args__ = (
+        # Serves the actors list search: one trigram index over the text that
+        # search_filter matches, usable by a leading-wildcard ILIKE
+        db.Index('ix_actor_search_trgm',
+                 db.text("(surname || ' ' || given_name || ' ' || actor_id) gin_trgm_ops"),
+                 postgresql_using='gin'),
+    )
+    
     # Relationships
     tenures = db.relationship('Tenure', back_populates='actor', cascade='all, delete-orphan')
     
@@ -151,13 +230,24 @@ class Actor(db.Model):
     
     def get_display_name(self):
         """Format name as SURNAME, Given Middle"""
-        if self.middle_name:
-            return f'{self.surname.upper()}, {self.given_name} {self.middle_name}'
-        return f'{self.surname.upper()}, {self.given_name}'
+        return self.format_display_name(self.surname, self.given_name, self.middle_name)
+    
+    @staticmethod
+    def format_display_name(surname, given_name, middle_name=None):
+        """Format name parts as SURNAME, Given Middle without loading an Actor"""
+        if middle_name:
+            return f'{surname.upper()}, {given_name} {middle_name}'
+        return f'{surname.upper()}, {given_name}'
+    
+    @classmethod
+    def search_filter(cls, text):
+        """WHERE clause matching text anywhere in the surname, given name or actor_id"""
+        search_text = cls.surname + ' ' + cls.given_name + ' ' + cls.actor_id
+        return search_text.ilike(f'%{text}%')
     
     def get_current_positions(self):
         """Get all positions currently held by this actor"""
-        current_tenures = Tenure.query.filter_by(
+        current_tenures = Tenure.query.options(selectinload(Tenure.position)).filter_by(
             actor_id=self.actor_id,
             tenure_end=None
         ).all()
@@ -165,13 +255,17 @@ class Actor(db.Model):
     
     def get_positions_on_date(self, date):
         """Get all positions held by this actor on a specific date"""
-        tenures = Tenure.query.filter(
+        tenures = Tenure.query.options(selectinload(Tenure.position)).filter(
             Tenure.actor_id == self.actor_id,
             Tenure.tenure_start <= date,
             db.or_(Tenure.tenure_end.is_(None), Tenure.tenure_end >= date)
         ).all()
         return [tenure.position for tenure in tenures]
-    
+
+
+# ix_actor_search_trgm's operator class comes from pg_trgm
+event.listen(Actor.__table__, 'before_create', DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+
 class ActorRelationship(db.Model):
     """Relationships between actors - family and professional connections"""
     __tablename__ = 'actor_relationships'
@@ -267,6 +361,16 @@ class Tenure(db.Model):
             name='chk_tenure_dates'
         ),
         db.UniqueConstraint('actor_id', 'position_code', 'tenure_start', name='unique_tenure'),
+        # Serves the overlap check in TenureForm.validate
+        db.Index('ix_tenure_overlap', 'position_code', 'tenure_start',
+                 db.text("COALESCE(tenure_end, '9999-12-31'::date)")),
+        # Current holder/positions lookups only touch open tenures
+        db.Index('ix_tenure_current_position', 'position_code',
+                 postgresql_where=db.text('tenure_end IS NULL')),
+        db.Index('ix_tenure_current_actor', 'actor_id',
+                 postgresql_where=db.text('tenure_end IS NULL')),
+        # Actor.get_positions_on_date range scan
+        db.Index('ix_tenure_actor_range', 'actor_id', 'tenure_start', 'tenure_end'),
     )
     
     def __repr__(self):
@@ -337,7 +441,9 @@ class MarkedScenario(db.Model):
     # Probability tracking
     current_probability = db.Column(db.Numeric(4, 3))  # 0.000 to 1.000
     initial_probability = db.Column(db.Numeric(4, 3))  # Starting assessment
-    probability_history = db.Column(db.JSON)  # Array of {probability, timestamp, reason, event_code, user_id}
+    # Array of {probability, timestamp, reason, event_code, user_id}; writers
+    # append to it server-side with jsonb ||, never in place on the instance
+    probability_history = db.Column(JSONB)
     
     # Status and metadata
     status = db.Column(db.String(20), default='active')  # active, resolved_true, resolved_false, deprecated
@@ -377,6 +483,38 @@ class MarkedScenario(db.Model):
         
         return link
     
+    def remove_event(self, link, user_id):
+        """Unlink an event and take its weight back off the probability"""
+        # Previous probability minus the link's weight, clamped to [0, 1];
+        # computed and appended to the history in one UPDATE, like
+        # recalculate_probability
+        new_prob = db.func.greatest(0.0, db.func.least(1.0,
+            MarkedScenario.current_probability - link.weight
+        ))
+        
+        entry = db.func.jsonb_build_object('probability', new_prob).op('||')(db.cast({
+            'timestamp': datetime.utcnow().isoformat(),
+            'reason': f'Event {link.event_code} unlinked (weight {link.weight} removed)',
+            'event_code': link.event_code,
+            'user_id': user_id
+        }, JSONB))
+        
+        # With no current probability GREATEST/LEAST would skip the NULL and
+        # store 1, so leave the row alone and report it instead
+        updated = db.session.execute(
+            db.update(MarkedScenario)
+            .where(MarkedScenario.id == self.id, MarkedScenario.current_probability.isnot(None))
+            .values(
+                current_probability=new_prob,
+                probability_history=self._history_or_empty().op('||')(db.func.jsonb_build_array(entry)),
+                updated_at=datetime.utcnow()
+            )
+        )
+        if not updated.rowcount:
+            raise self._missing_probability()
+        
+        db.session.delete(link)
+    
     def recalculate_probability(self, event_code, weight, user_id):
         """
         Update probability based on new event using categorical weighting algorithm.
@@ -395,25 +533,114 @@ class MarkedScenario(db.Model):
         # Calculate immediate adjustment
         result = ProbabilityCalculator.calculate_immediate(float(weight))
         
-        # Get previous probability
-        previous_prob = float(self.current_probability) if self.current_probability else float(self.initial_probability)
+        # Previous probability (current, or initial while current is unset/0),
+        # adjusted and clamped to [0, 1]; computed in the UPDATE itself so the
+        # read-modify-write happens on the row, not on this instance
+        previous_prob = db.func.coalesce(db.func.nullif(MarkedScenario.current_probability, 0),
+                                         MarkedScenario.initial_probability)
+        new_prob = db.func.greatest(0.0, db.func.least(1.0,
+            previous_prob + result['probability_adjustment']
+        ))
+        
+        # History entry with full calculation metadata
+        entry = self._history_entry(event_code, weight, user_id, result)
+        entry = db.func.jsonb_build_object('probability', new_prob).op('||')(db.cast(entry, JSONB))
+        
+        # Append server-side instead of sending the whole history back
+        history = self._history_or_empty().op('||')(db.func.jsonb_build_array(entry))
+        
+        # One UPDATE for probability, history and timestamp. GREATEST/LEAST
+        # skip NULLs, so a scenario with no probability at all is left alone
+        # (it would otherwise be set to 1) and reported instead
+        updated = db.session.execute(
+            db.update(MarkedScenario)
+            .where(MarkedScenario.id == self.id, previous_prob.isnot(None))
+            .values(
+                current_probability=new_prob,
+                probability_history=history,
+                updated_at=datetime.utcnow()
+            )
+        )
+        if not updated.rowcount:
+            raise self._missing_probability()
+        
+        # TODO: Trigger async batch recalculation for 1-day, 7-day, 30-day windows
+        # This will be handled by scheduled jobs writing to time-series storage
+    
+    def bulk_add_events(self, items):
+        """
+        Link several events at once, with the same result as calling
+        add_event for each in order.
+        
+        Args:
+            items: Iterable of (event_code, weight, user_id, notes)
         
-        # Apply adjustment
-        new_prob = previous_prob + result['probability_adjustment']
+        Issues one multi-row INSERT for the links and a single UPDATE for
+        probability and history, instead of an INSERT and UPDATE per event.
+        """
+        from app.probability_algorithms import ProbabilityCalculator
         
-        # Clamp to [0, 1]
-        new_prob = max(0.0, min(1.0, new_prob))
+        items = list(items)
+        if not items:
+            return
         
-        # Update current probability
-        self.current_probability = new_prob
-        flag_modified(self, 'current_probability')
+        # Adjustments for every weight in one array pass; raises on an
+        # invalid weight before anything is written
+        results = ProbabilityCalculator.calculate_immediate_batch(
+            [float(weight) for _, weight, _, _ in items]
+        )
         
-        # Add to history with full calculation metadata
-        if not self.probability_history:
-            self.probability_history = []
+        # Lock the row so the adjustments start from its latest probability
+        current, initial = db.session.execute(
+            db.select(MarkedScenario.current_probability, MarkedScenario.initial_probability)
+            .where(MarkedScenario.id == self.id)
+            .with_for_update()
+        ).one()
         
-        self.probability_history.append({
-            'probability': float(new_prob),
+        # Apply each adjustment in turn, as add_event would: start from the
+        # initial probability whenever the current one is unset or 0, clamp
+        # to [0, 1] and round to the column's 3 places before the next one.
+        # Worked out before the INSERT, so a failure writes nothing
+        stored = current
+        entries = []
+        for i, (event_code, weight, user_id, notes) in enumerate(items):
+            previous = stored if stored else initial
+            if previous is None:
+                raise self._missing_probability()
+            result = {key: values[i] for key, values in results.items()}
+            new_prob = previous + Decimal(repr(result['probability_adjustment']))
+            new_prob = max(Decimal(0), min(Decimal(1), new_prob))
+            stored = new_prob.quantize(Decimal('0.001'), rounding=ROUND_HALF_UP)
+            
+            entry = {'probability': float(new_prob)}
+            entry.update(self._history_entry(event_code, weight, user_id, result))
+            entries.append(entry)
+        
+        db.session.execute(db.insert(ScenarioEvent), [
+            {
+                'marked_scenario_id': self.id,
+                'event_code': event_code,
+                'weight': weight,
+                'notes': notes,
+                'linked_by_id': user_id
+            }
+            for event_code, weight, user_id, notes in items
+        ])
+        
+        db.session.execute(
+            db.update(MarkedScenario)
+            .where(MarkedScenario.id == self.id)
+            .values(
+                current_probability=stored,
+                probability_history=self._history_or_empty().op('||')(db.cast(entries, JSONB)),
+                updated_at=datetime.utcnow()
+            )
+        )
+    
+    @staticmethod
+    def _history_entry(event_code, weight, user_id, result):
+        """probability_history fields for a linked event, minus the probability"""
+        return {
             'timestamp': datetime.utcnow().isoformat(),
             'reason': f'Event {event_code} linked',
             'event_code': event_code,
@@ -425,17 +652,23 @@ class MarkedScenario(db.Model):
             'adjusted_weight': result['adjusted_weight'],
             'basis_points': result['basis_points'],
             'probability_adjustment': result['probability_adjustment']
-        })
-        
-        flag_modified(self, 'probability_history')
-
-        self.updated_at = datetime.utcnow()
-        
-        # TODO: Trigger async batch recalculation for 1-day, 7-day, 30-day windows
-        # This will be handled by scheduled jobs writing to time-series storage
+        }
+    
+    def _missing_probability(self):
+        """Error for adjusting a scenario that has no probability to start from"""
+        return ValueError(f'Marked scenario {self.id} has no probability set')
+    
+    @staticmethod
+    def _history_or_empty():
+        """probability_history as a jsonb array; an unset history may be SQL NULL or a JSON null"""
+        return db.func.coalesce(
+            db.func.nullif(MarkedScenario.probability_history, db.cast(None, JSONB)),
+            db.cast([], JSONB)
+        )
     
     def __repr__(self):
-        return f'<MarkedScenario {self.display_name}>'
+        # Column values only; display_name would lazy-load analyst and scenario
+        return f'<MarkedScenario {self.id}: scenario={self.scenario_id} analyst={self.analyst_id}>'
 
 
 class ScenarioEvent(db.Model):
@@ -443,7 +676,9 @@ class ScenarioEvent(db.Model):
     __tablename__ = 'scenario_events'
     
     id = db.Column(db.Integer, primary_key=True)
-    marked_scenario_id = db.Column(db.Integer, db.ForeignKey('marked_scenarios.id', ondelete='CASCADE'), nullable=False, index=True)
+    # No single-column index: uq_marked_scenario_event and ix_se_scenario_weight
+    # both lead with marked_scenario_id
+    marked_scenario_id = db.Column(db.Integer, db.ForeignKey('marked_scenarios.id', ondelete='CASCADE'), nullable=False)
     event_code = db.Column(db.String(50), db.ForeignKey('control_frame.event_code', ondelete='CASCADE'), nullable=False, index=True)
     weight = db.Column(db.Numeric(4, 1))  # -12.0 to 12.0 in 0.1 increments
     notes = db.Column(db.Text)  # Analyst's explanation for linking
@@ -452,12 +687,16 @@ class ScenarioEvent(db.Model):
     
     # Relationships
     marked_scenario = db.relationship('MarkedScenario', back_populates='event_links')
-    event = db.relationship('ControlFrame', backref='scenario_links')
+    event = db.relationship('ControlFrame', back_populates='scenario_links')
     linked_by = db.relationship('User')
     
     # Prevent duplicate links
     __table_args__ = (
         db.UniqueConstraint('marked_scenario_id', 'event_code', name='uq_marked_scenario_event'),
+        # Covers the per-scenario link/weight reads (compute_marked_metrics)
+        # so they can be answered with an index-only scan
+        db.Index('ix_se_scenario_weight', 'marked_scenario_id',
+                 postgresql_include=['event_code', 'weight', 'linked_at']),
     )
     
     def __repr__(self):
@@ -6,6 +6,25 @@ Loads Lark grammar and parses CIE event strings
 from lark import Lark, Tree, Token
 from lark.exceptions import LarkError
 import os
+import threading
+
+# One Lark instance per grammar file, shared by every CIEParser in the process
+_LARK_CACHE = {}
+_LARK_CACHE_LOCK = threading.Lock()
+
+
+def _get_lark(grammar_path):
+    """Return the Lark parser for grammar_path, building it on first use"""
+    with _LARK_CACHE_LOCK:
+        lark_parser = _LARK_CACHE.get(grammar_path)
+        if lark_parser is None:
+            # cache=True pickles the LALR tables to the temp dir, keyed on the
+            # grammar text and checked against the imported terminals file,
+            # so only the first start-up builds them
+            lark_parser = Lark.open(grammar_path, start='event', parser='lalr', cache=True)
+            _LARK_CACHE[grammar_path] = lark_parser
+        return lark_parser
+
 
 class CIEParser:
     """Parser for Compressed Information Expression (CIE) event strings"""
@@ -22,12 +41,9 @@ class CIEParser:
             base_dir = os.path.dirname(os.path.abspath(__file__))
             grammar_path = os.path.join(base_dir, 'grammar', 'cie.lark')
         
-        # Load grammar file
-        # with open(grammar_path, 'r', encoding='utf-8') as f:
-            # grammar = f.read()
-        
-        # Initialize Lark parser
-        self.parser = Lark.open(grammar_path, start='event', parser='lalr')
+        # Initialize Lark parser (shared across instances); Lark.open reads
+        # the grammar file itself
+        self.parser = _get_lark(os.path.abspath(grammar_path))
     
     def parse(self, cie_string):
         """
@@ -58,13 +74,21 @@ class CIEParser:
         Returns:
             dict with 'success' (bool), 'tree' (if success), 'error' (if failed)
         """
+        # Calls Lark directly rather than through parse(), so a failure is
+        # reported without first being re-raised as ParseError
         try:
-            tree = self.parse(cie_string)
+            tree = self.parser.parse(cie_string)
             return {
                 'success': True,
                 'tree': tree,
                 'error': None
             }
+        except LarkError as e:
+            return {
+                'success': False,
+                'tree': None,
+                'error': f"Failed to parse CIE string: {e}"
+            }
         except Exception as e:
             return {
                 'success': False,
@@ -7,10 +7,14 @@ analyst event weight assignments into probability adjustments, velocity,
 and volatility metrics across multiple time windows.
 """
 
+import math
 from datetime import datetime, timedelta
-from typing import List, Tuple, Dict, Optional
+from itertools import compress, repeat
+from typing import List, Tuple, Dict, Optional, Sequence, Union
 from decimal import Decimal
 
+import numpy as np
+
 
 class WeightCategory:
     """Weight category definitions with Fibonacci-inspired multipliers"""
@@ -30,6 +34,12 @@ class WeightCategory:
         Returns:
             Tuple of (category_name, multiplier)
         """
+        # Stored weights are in 0.1 steps, so an on-grid weight is a table
+        # lookup; anything else goes through the range checks below
+        entry = _CATEGORY_BY_WEIGHT.get(abs_weight)
+        if entry is not None:
+            return entry
+        
         if cls.MINOR[0] <= abs_weight <= cls.MINOR[1]:
             return ('minor', cls.MINOR[2])
         elif cls.MODERATE[0] <= abs_weight <= cls.MODERATE[1]:
@@ -43,6 +53,129 @@ class WeightCategory:
             raise ValueError(f"Weight {abs_weight} outside valid range [0.1-12.0]")
 
 
+# Category bounds as arrays (MINOR..CRITICAL order) for the batch calculations
+_CATEGORY_LOWS = np.array([WeightCategory.MINOR[0], WeightCategory.MODERATE[0],
+                           WeightCategory.MAJOR[0], WeightCategory.CRITICAL[0]])
+_CATEGORY_HIGHS = np.array([WeightCategory.MINOR[1], WeightCategory.MODERATE[1],
+                            WeightCategory.MAJOR[1], WeightCategory.CRITICAL[1]])
+_CATEGORY_MULTIPLIERS = np.array([WeightCategory.MINOR[2], WeightCategory.MODERATE[2],
+                                  WeightCategory.MAJOR[2], WeightCategory.CRITICAL[2]])
+_CATEGORY_NAMES = np.array(['minor', 'moderate', 'major', 'critical'])
+
+# The same multipliers as plain ints, for the per-call result arithmetic
+_MINOR_MULTIPLIER, _MODERATE_MULTIPLIER, _MAJOR_MULTIPLIER, _CRITICAL_MULTIPLIER = (
+    _CATEGORY_MULTIPLIERS.tolist()
+)
+
+# categorize() result for every valid weight 0.1..12.0 in 0.1 steps, filled
+# from its range checks (used while the table is still empty)
+_CATEGORY_BY_WEIGHT = {}
+_CATEGORY_BY_WEIGHT.update(
+    (tenths / 10, WeightCategory.categorize(tenths / 10)) for tenths in range(1, 121)
+)
+
+
+def _categorize_array(abs_weights: np.ndarray) -> np.ndarray:
+    """
+    WeightCategory.categorize over an array of absolute weights.
+    
+    Returns:
+        Category index per weight (0=minor .. 3=critical)
+    """
+    # Last category whose lower bound is <= |weight|, then check its upper bound
+    cat_idx = np.searchsorted(_CATEGORY_LOWS, abs_weights, side='right') - 1
+    valid = (cat_idx >= 0) & (abs_weights <= _CATEGORY_HIGHS[cat_idx.clip(0)])
+    if not valid.all():
+        raise ValueError(f"Weight {abs_weights[~valid][0]} outside valid range [0.1-12.0]")
+    return cat_idx
+
+
+# Below this many events the fixed cost of the numpy calls outweighs a plain loop
+_ARRAY_MIN_EVENTS = 32
+
+
+def _category_sums(weights: np.ndarray,
+                   window: Optional[List[bool]] = None) -> Tuple[List[float], List[float]]:
+    """
+    Sum weights by category, both with their sign and as absolute values.
+    
+    Args:
+        weights: Event weights
+        window: Optional flag per event; if given, the absolute sums only
+                cover the events whose flag is set
+    
+    Returns:
+        Tuple of (signed_sums, absolute_sums), each [minor, moderate, major,
+        critical] and added in event order
+    """
+    if len(weights) < _ARRAY_MIN_EVENTS:
+        lowest = WeightCategory.MINOR[0]
+        moderate, major, critical = _CATEGORY_LOWS[1:].tolist()
+        highs = _CATEGORY_HIGHS.tolist()
+        signed_sums = [0.0, 0.0, 0.0, 0.0]
+        abs_sums = [0.0, 0.0, 0.0, 0.0]
+        for weight, in_window in zip(weights.tolist(), window or repeat(True)):
+            abs_weight = abs(weight)
+            # Category index without branching: the number of lower bounds reached
+            idx = (abs_weight >= moderate) + (abs_weight >= major) + (abs_weight >= critical)
+            if not lowest <= abs_weight <= highs[idx]:
+                raise ValueError(f"Weight {abs_weight} outside valid range [0.1-12.0]")
+            # The weight itself carries the sign
+            signed_sums[idx] += weight
+            if in_window:
+                abs_sums[idx] += abs_weight
+        return signed_sums, abs_sums
+    
+    abs_weights = np.abs(weights)
+    cat_idx = _categorize_array(abs_weights)
+    signed_sums = np.bincount(cat_idx, weights=weights, minlength=4)
+    if window is not None:
+        window = np.array(window, dtype=bool)
+        cat_idx, abs_weights = cat_idx[window], abs_weights[window]
+    abs_sums = np.bincount(cat_idx, weights=abs_weights, minlength=4)
+    return signed_sums.tolist(), abs_sums.tolist()
+
+
+class EventBatch:
+    """
+    Events as parallel columns instead of (event_code, weight, timestamp) tuples.
+    
+    The calculators only read the weights (and the window filter only the
+    timestamps), so keeping weights in one float array lets them run over it
+    directly, and lets one conversion serve several calculations.
+    """
+    __slots__ = ('codes', 'weights', 'timestamps')
+    
+    def __init__(self, codes: list, weights: np.ndarray, timestamps: list):
+        self.codes = codes
+        self.weights = weights
+        self.timestamps = timestamps
+    
+    @classmethod
+    def from_events(cls, events: Union['EventBatch', List[Tuple[str, float, datetime]]]) -> 'EventBatch':
+        """Build from (event_code, weight, timestamp) tuples; an EventBatch is returned as is"""
+        if isinstance(events, cls):
+            return events
+        codes, weights, timestamps = zip(*events) if events else ((), (), ())
+        return cls(list(codes), np.array(weights, dtype=float), list(timestamps))
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def window_mask(self, start: datetime, end: Optional[datetime] = None) -> List[bool]:
+        """Per event, whether start <= timestamp (< end, if given)"""
+        if end is None:
+            return [ts >= start for ts in self.timestamps]
+        return [start <= ts < end for ts in self.timestamps]
+    
+    def between(self, start: datetime, end: Optional[datetime] = None) -> 'EventBatch':
+        """Events with start <= timestamp (< end, if given)"""
+        mask = self.window_mask(start, end)
+        return EventBatch(list(compress(self.codes, mask)),
+                          self.weights[np.array(mask, dtype=bool)],
+                          list(compress(self.timestamps, mask)))
+
+
 class ProbabilityCalculator:
     """
     Calculates probability adjustments from event weights using categorical weighting.
@@ -73,13 +206,21 @@ class ProbabilityCalculator:
                 - adjusted_weight: Category-modified weight
                 - category: Weight category name
         """
+        # Stored weights are in 0.1 steps, so every on-grid result is precomputed
+        result = _IMMEDIATE_BY_WEIGHT.get(weight)
+        if result is not None:
+            return dict(result)
+        return ProbabilityCalculator._compute_immediate(weight)
+    
+    @staticmethod
+    def _compute_immediate(weight: float) -> Dict[str, float]:
+        """calculate_immediate without the precomputed table"""
         # Step 1: Categorize and apply multiplier
         abs_weight = abs(weight)
         category, multiplier = WeightCategory.categorize(abs_weight)
         
         # Step 2: Apply multiplier (preserve sign)
-        sign = 1 if weight > 0 else -1
-        adjusted_weight = abs_weight * multiplier * sign
+        adjusted_weight = math.copysign(abs_weight * multiplier, weight)
         
         # Step 3: Convert to basis points (immediate = 4x)
         basis_points = adjusted_weight * ProbabilityCalculator.CONVERSION_IMMEDIATE
@@ -96,13 +237,45 @@ class ProbabilityCalculator:
         }
     
     @staticmethod
-    def calculate_batch(events: List[Tuple[str, float, datetime]], 
+    def calculate_immediate_batch(weights: Sequence[float]) -> Dict[str, list]:
+        """
+        calculate_immediate for many events at once, computed over arrays.
+        
+        Args:
+            weights: Event weights (-12.0 to +12.0, excluding 0)
+            
+        Returns:
+            Dictionary with the same keys as calculate_immediate, each
+            holding a list with one value per weight (in input order)
+        """
+        weights = np.asarray(weights, dtype=float)
+        abs_weights = np.abs(weights)
+        
+        # Step 1: Categorize
+        cat_idx = _categorize_array(abs_weights)
+        multipliers = _CATEGORY_MULTIPLIERS[cat_idx]
+        
+        # Steps 2-4 as in calculate_immediate
+        adjusted_weights = np.copysign(abs_weights * multipliers, weights)
+        basis_points = adjusted_weights * ProbabilityCalculator.CONVERSION_IMMEDIATE
+        probability_adjustments = basis_points / 10000
+        
+        return {
+            'probability_adjustment': np.round(probability_adjustments, 6).tolist(),
+            'basis_points': np.round(basis_points, 2).tolist(),
+            'adjusted_weight': np.round(adjusted_weights, 2).tolist(),
+            'category': _CATEGORY_NAMES[cat_idx].tolist(),
+            'multiplier': multipliers.tolist()
+        }
+    
+    @staticmethod
+    def calculate_batch(events: Union[EventBatch, List[Tuple[str, float, datetime]]], 
                        window_type: str = '1day') -> Dict[str, float]:
         """
         Calculate batched probability adjustment from multiple events.
         
         Args:
-            events: List of (event_code, weight, timestamp) tuples
+            events: List of (event_code, weight, timestamp) tuples, or an EventBatch
             window_type: '1day', '7day', or '30day'
             
         Returns:
@@ -113,7 +286,16 @@ class ProbabilityCalculator:
                 - category_breakdown: Dict of weights by category
                 - event_count: Number of events in batch
         """
-        if not events:
+        events = EventBatch.from_events(events)
+        
+        # Step 1: Categorize and sum weights by category (sign preserved)
+        signed_sums, _ = _category_sums(events.weights)
+        return ProbabilityCalculator._batch_result(signed_sums, len(events), window_type)
+    
+    @staticmethod
+    def _batch_result(signed_sums: List[float], event_count: int, window_type: str) -> Dict[str, float]:
+        """calculate_batch steps 2-5, from the signed per-category sums"""
+        if not event_count:
             return {
                 'probability_adjustment': 0.0,
                 'basis_points': 0.0,
@@ -122,26 +304,13 @@ class ProbabilityCalculator:
                 'event_count': 0
             }
         
-        # Step 1: Categorize and sum weights by category
-        category_sums = {
-            'minor': 0.0,
-            'moderate': 0.0,
-            'major': 0.0,
-            'critical': 0.0
-        }
-        
-        for event_code, weight, timestamp in events:
-            abs_weight = abs(weight)
-            category, _ = WeightCategory.categorize(abs_weight)
-            # Preserve sign when summing
-            sign = 1 if weight > 0 else -1
-            category_sums[category] += abs_weight * sign
+        minor_sum, moderate_sum, major_sum, critical_sum = signed_sums
         
         # Step 2: Apply category multipliers
-        modified_minor = category_sums['minor'] * WeightCategory.MINOR[2]
-        modified_moderate = category_sums['moderate'] * WeightCategory.MODERATE[2]
-        modified_major = category_sums['major'] * WeightCategory.MAJOR[2]
-        modified_critical = category_sums['critical'] * WeightCategory.CRITICAL[2]
+        modified_minor = minor_sum * _MINOR_MULTIPLIER
+        modified_moderate = moderate_sum * _MODERATE_MULTIPLIER
+        modified_major = major_sum * _MAJOR_MULTIPLIER
+        modified_critical = critical_sum * _CRITICAL_MULTIPLIER
         
         # Step 3: Calculate net adjusted weight
         adjusted_weight = modified_minor + modified_moderate + modified_major + modified_critical
@@ -157,16 +326,23 @@ class ProbabilityCalculator:
             'basis_points': round(basis_points, 2),
             'adjusted_weight': round(adjusted_weight, 2),
             'category_breakdown': {
-                'minor': {'sum': round(category_sums['minor'], 2), 'modified': round(modified_minor, 2)},
-                'moderate': {'sum': round(category_sums['moderate'], 2), 'modified': round(modified_moderate, 2)},
-                'major': {'sum': round(category_sums['major'], 2), 'modified': round(modified_major, 2)},
-                'critical': {'sum': round(category_sums['critical'], 2), 'modified': round(modified_critical, 2)}
+                'minor': {'sum': round(minor_sum, 2), 'modified': round(modified_minor, 2)},
+                'moderate': {'sum': round(moderate_sum, 2), 'modified': round(modified_moderate, 2)},
+                'major': {'sum': round(major_sum, 2), 'modified': round(modified_major, 2)},
+                'critical': {'sum': round(critical_sum, 2), 'modified': round(modified_critical, 2)}
             },
-            'event_count': len(events),
+            'event_count': event_count,
             'window_type': window_type
         }
 
 
+# calculate_immediate result for every valid weight, -12.0..12.0 in 0.1 steps
+_IMMEDIATE_BY_WEIGHT = {
+    tenths / 10: ProbabilityCalculator._compute_immediate(tenths / 10)
+    for tenths in range(-120, 121) if tenths
+}
+
+
 class VolatilityCalculator:
     """
     Calculates volatility metric: total absolute analytical activity in a time window.
@@ -176,12 +352,12 @@ class VolatilityCalculator:
     """
     
     @staticmethod
-    def calculate(events: List[Tuple[str, float, datetime]]) -> Dict[str, float]:
+    def calculate(events: Union[EventBatch, List[Tuple[str, float, datetime]]]) -> Dict[str, float]:
         """
         Calculate volatility from a batch of events.
         
         Args:
-            events: List of (event_code, weight, timestamp) tuples
+            events: List of (event_code, weight, timestamp) tuples, or an EventBatch
             
         Returns:
             Dictionary with:
@@ -189,31 +365,53 @@ class VolatilityCalculator:
                 - category_breakdown: Absolute sums by category
                 - event_count: Number of events
         """
-        if not events:
+        events = EventBatch.from_events(events)
+        
+        # Step 1: Categorize and sum absolute weights by category
+        _, abs_sums = _category_sums(events.weights)
+        return VolatilityCalculator._result(abs_sums, len(events))
+    
+    @staticmethod
+    def calculate_windowed(events: Union[EventBatch, List[Tuple[str, float, datetime]]],
+                           cutoff: Optional[datetime] = None) -> Dict[str, float]:
+        """
+        Calculate volatility from the events at or after cutoff.
+        
+        Same result as calculate() on the filtered events, but only the
+        weights in the window are picked out instead of a filtered event list.
+        
+        Args:
+            events: List of (event_code, weight, timestamp) tuples, or an EventBatch
+            cutoff: Earliest timestamp counted (all events if None)
+            
+        Returns:
+            Same dictionary as calculate()
+        """
+        events = EventBatch.from_events(events)
+        weights = events.weights
+        if cutoff is not None:
+            weights = weights[np.array(events.window_mask(cutoff), dtype=bool)]
+        
+        _, abs_sums = _category_sums(weights)
+        return VolatilityCalculator._result(abs_sums, len(weights))
+    
+    @staticmethod
+    def _result(abs_sums: List[float], event_count: int) -> Dict[str, float]:
+        """calculate steps 2-3, from the absolute per-category sums"""
+        if not event_count:
             return {
                 'volatility_score': 0.0,
                 'category_breakdown': {},
                 'event_count': 0
             }
         
-        # Step 1: Categorize and sum absolute weights by category
-        category_abs_sums = {
-            'minor': 0.0,
-            'moderate': 0.0,
-            'major': 0.0,
-            'critical': 0.0
-        }
-        
-        for event_code, weight, timestamp in events:
-            abs_weight = abs(weight)
-            category, _ = WeightCategory.categorize(abs_weight)
-            category_abs_sums[category] += abs_weight
+        minor_sum, moderate_sum, major_sum, critical_sum = abs_sums
         
         # Step 2: Apply category multipliers
-        modified_minor = category_abs_sums['minor'] * WeightCategory.MINOR[2]
-        modified_moderate = category_abs_sums['moderate'] * WeightCategory.MODERATE[2]
-        modified_major = category_abs_sums['major'] * WeightCategory.MAJOR[2]
-        modified_critical = category_abs_sums['critical'] * WeightCategory.CRITICAL[2]
+        modified_minor = minor_sum * _MINOR_MULTIPLIER
+        modified_moderate = moderate_sum * _MODERATE_MULTIPLIER
+        modified_major = major_sum * _MAJOR_MULTIPLIER
+        modified_critical = critical_sum * _CRITICAL_MULTIPLIER
         
         # Step 3: Sum to raw volatility (no transformation for now)
         volatility_score = modified_minor + modified_moderate + modified_major + modified_critical
@@ -221,12 +419,12 @@ class VolatilityCalculator:
         return {
             'volatility_score': round(volatility_score, 2),
             'category_breakdown': {
-                'minor': {'sum': round(category_abs_sums['minor'], 2), 'modified': round(modified_minor, 2)},
-                'moderate': {'sum': round(category_abs_sums['moderate'], 2), 'modified': round(modified_moderate, 2)},
-                'major': {'sum': round(category_abs_sums['major'], 2), 'modified': round(modified_major, 2)},
-                'critical': {'sum': round(category_abs_sums['critical'], 2), 'modified': round(modified_critical, 2)}
+                'minor': {'sum': round(minor_sum, 2), 'modified': round(modified_minor, 2)},
+                'moderate': {'sum': round(moderate_sum, 2), 'modified': round(modified_moderate, 2)},
+                'major': {'sum': round(major_sum, 2), 'modified': round(modified_major, 2)},
+                'critical': {'sum': round(critical_sum, 2), 'modified': round(modified_critical, 2)}
             },
-            'event_count': len(events)
+            'event_count': event_count
         }
 
 
@@ -265,6 +463,33 @@ class TimeWindowFilter:
     - 30-day: Rolling 30 days (today + previous 29 days)
     """
     
+    @staticmethod
+    def window_bounds(window_type: str,
+                      reference_date: Optional[datetime] = None) -> Tuple[datetime, Optional[datetime]]:
+        """
+        Start and end of a time window.
+        
+        Args:
+            window_type: '1day', '7day', or '30day'
+            reference_date: Date to use (defaults to now)
+            
+        Returns:
+            Tuple of (start, end); end is None for the rolling windows
+        """
+        if reference_date is None:
+            reference_date = datetime.utcnow()
+        
+        if window_type == '1day':
+            # UTC midnight of reference date
+            day_start = reference_date.replace(hour=0, minute=0, second=0, microsecond=0)
+            return day_start, day_start + timedelta(days=1)
+        elif window_type == '7day':
+            return reference_date - timedelta(days=7), None
+        elif window_type == '30day':
+            return reference_date - timedelta(days=30), None
+        else:
+            raise ValueError(f"Unknown window_type: {window_type}")
+    
     @staticmethod
     def filter_1day(events: List[Tuple[str, float, datetime]], 
                    reference_date: Optional[datetime] = None) -> List[Tuple[str, float, datetime]]:
@@ -278,12 +503,7 @@ class TimeWindowFilter:
         Returns:
             Filtered list of events
         """
-        if reference_date is None:
-            reference_date = datetime.utcnow()
-        
-        # UTC midnight of reference date
-        day_start = reference_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start + timedelta(days=1)
+        day_start, day_end = TimeWindowFilter.window_bounds('1day', reference_date)
         
         return [(code, weight, ts) for code, weight, ts in events 
                 if day_start <= ts < day_end]
@@ -301,10 +521,7 @@ class TimeWindowFilter:
         Returns:
             Filtered list of events
         """
-        if reference_date is None:
-            reference_date = datetime.utcnow()
-        
-        cutoff = reference_date - timedelta(days=7)
+        cutoff, _ = TimeWindowFilter.window_bounds('7day', reference_date)
         
         return [(code, weight, ts) for code, weight, ts in events 
                 if ts >= cutoff]
@@ -322,10 +539,7 @@ class TimeWindowFilter:
         Returns:
             Filtered list of events
         """
-        if reference_date is None:
-            reference_date = datetime.utcnow()
-        
-        cutoff = reference_date - timedelta(days=30)
+        cutoff, _ = TimeWindowFilter.window_bounds('30day', reference_date)
         
         return [(code, weight, ts) for code, weight, ts in events 
                 if ts >= cutoff]
@@ -372,19 +586,14 @@ def calculate_all_metrics(events: List[Tuple[str, float, datetime]],
     
     else:
         # Batch calculation
-        # Filter events by window
-        if window_type == '1day':
-            filtered_events = TimeWindowFilter.filter_1day(events, reference_date)
-        elif window_type == '7day':
-            filtered_events = TimeWindowFilter.filter_7day(events, reference_date)
-        elif window_type == '30day':
-            filtered_events = TimeWindowFilter.filter_30day(events, reference_date)
-        else:
-            raise ValueError(f"Unknown window_type: {window_type}")
-        
-        # Calculate metrics
-        prob_result = ProbabilityCalculator.calculate_batch(filtered_events, window_type)
-        vol_result = VolatilityCalculator.calculate(filtered_events)
+        # Filter events by window, converting them to columns once for both calculators
+        start, end = TimeWindowFilter.window_bounds(window_type, reference_date)
+        filtered_events = EventBatch.from_events(events).between(start, end)
+        
+        # Calculate metrics, categorizing the window's events once for both
+        signed_sums, abs_sums = _category_sums(filtered_events.weights)
+        prob_result = ProbabilityCalculator._batch_result(signed_sums, len(filtered_events), window_type)
+        vol_result = VolatilityCalculator._result(abs_sums, len(filtered_events))
         velocity = VelocityCalculator.calculate(vol_result['volatility_score'], 
                                                vol_result['event_count'])
         
@@ -433,35 +642,44 @@ class NarrativeCalculator:
 
     @staticmethod
     def calculate(narrative) -> dict:
+        from app import db
         from app.models import ControlFrame
 
         scenario_short_total = 0.0
         scenario_long_total = 0.0
         scenario_count = 0
 
+        # One 30-day window for every scenario of this narrative
+        cutoff_30, _ = TimeWindowFilter.window_bounds('30day')
+
         # Channel 1: Linked Marked Scenarios
         for ns in narrative.narrative_scenarios:
             direction = 1 if ns.relationship else -1
             potency = float(ns.potency)
 
-            events = [
+            # Converted to columns once, for both the 30-day and lifetime figures
+            events = EventBatch.from_events([
                 (link.event_code, float(link.weight), link.linked_at)
                 for link in ns.marked_scenario.event_links
-            ]
+            ])
             if not events:
                 continue  # no events → contribute 0
 
             scenario_count += 1
 
+            # Categorize once: signed sums over the lifetime, absolute sums
+            # over the 30-day window
+            in_window_30 = events.window_mask(cutoff_30)
+            signed_sums, abs_sums_30 = _category_sums(events.weights, in_window_30)
+
             # Short-term: 30-day window
-            filtered_30 = TimeWindowFilter.filter_30day(events)
-            vol_result = VolatilityCalculator.calculate(filtered_30)
+            vol_result = VolatilityCalculator._result(abs_sums_30, sum(in_window_30))
             volatility = vol_result['volatility_score']
             velocity = VelocityCalculator.calculate(volatility, vol_result['event_count'])
             short_contribution = (volatility + velocity) / 2 * potency * direction / 100
 
             # Long-term: full lifetime net accumulated weight
-            all_events_batch = ProbabilityCalculator.calculate_batch(events)
+            all_events_batch = ProbabilityCalculator._batch_result(signed_sums, len(events), '1day')
             net_weight = all_events_batch['adjusted_weight']
             long_contribution = net_weight * potency * direction / 100
 
@@ -475,13 +693,19 @@ class NarrativeCalculator:
 
         weight_map = {1.5: 0.65, 1.0: 0.35, 0.5: 0.2}
 
-        for rc in narrative.narrative_resolutions:
-            fulfilled = ControlFrame.query.filter(
+        # Whether each condition has a matching event, as one EXISTS per
+        # condition in a single query
+        resolutions = narrative.narrative_resolutions
+        fulfilled_flags = db.session.execute(db.select(*[
+            db.exists().where(
                 ControlFrame.event_actor.ilike(f'%{rc.entity_code}%'),
                 ControlFrame.action_code == rc.action_code,
                 ControlFrame.rec_timestamp <= narrative.res_horizon,
-            ).first() is not None
+            )
+            for rc in resolutions
+        ])).one() if resolutions else ()
 
+        for rc, fulfilled in zip(resolutions, fulfilled_flags):
             if not fulfilled:
                 continue
 
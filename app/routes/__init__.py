@@ -1,15 +1,5 @@
-from flask import redirect, url_for
+# Blueprints are imported and registered by app.create_app(); importing this
+# package on its own does not load any route modules.
 
-# Import blueprints
-from . import articles, events, actors, positions, institutions
-
-# Define a default route for the root URL
-def register_routes(app):
-    """Register all route blueprints and add root redirect"""
-    
-    @app.route('/')
-    def index():
-        """Redirect root to articles dashboard"""
-        return redirect(url_for('articles.dashboard'))
-
-__all__ = ['articles', 'events', 'actors', 'positions', 'institutions']
\ No newline at end of file
+__all__ = ['articles', 'events', 'actors', 'positions', 'institutions', 'auth',
+           'dashboard', 'admin', 'scenarios', 'foundations', 'narratives_routes']
@@ -1,11 +1,17 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
-from app.models import Actor, Tenure
+from app.models import Actor, Tenure, Position
 from app.forms import ActorForm, ActorEditForm
 from app import db
 from flask_login import login_required
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+import re
 
 bp = Blueprint('actors', __name__, url_prefix='/actors')
 
+# Tries at inserting a new actor before giving up on ordinal collisions
+_CREATE_ATTEMPTS = 3
+
 
 @bp.route('/')
 @login_required
@@ -19,14 +25,7 @@ def index():
     query = Actor.query
     
     if search:
-        search_pattern = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                Actor.surname.ilike(search_pattern),
-                Actor.given_name.ilike(search_pattern),
-                Actor.actor_id.ilike(search_pattern)
-            )
-        )
+        query = query.filter(Actor.search_filter(search))
     
     # Sort by surname, given name
     query = query.order_by(Actor.surname, Actor.given_name)
@@ -43,9 +42,9 @@ def detail(actor_id):
     actor = Actor.query.get_or_404(actor_id)
     
     # Get all tenures for this actor
-    tenures = Tenure.query.filter_by(actor_id=actor_id).order_by(
-        Tenure.tenure_start.desc()
-    ).all()
+    tenures = Tenure.query.options(
+        joinedload(Tenure.position).joinedload(Position.institution)
+    ).filter_by(actor_id=actor_id).order_by(Tenure.tenure_start.desc()).all()
     
     return render_template('actors/detail.html', actor=actor, tenures=tenures)
 
@@ -61,37 +60,40 @@ def create():
         country = form.country_code.data.lower()
         year = form.birth_year.data
         
-        # Calculate next ordinal for this country/year
+        # Calculate next ordinal for this country/year: the highest numeric
+        # suffix under the prefix, found by the database in one query
         prefix = f'{country}.{year}.'
-        existing = Actor.query.filter(Actor.actor_id.like(f'{prefix}%')).all()
-        
-        if existing:
-            # Find highest existing ordinal
-            ordinals = []
-            for actor in existing:
-                parts = actor.actor_id.split('.')
-                if len(parts) == 3:
-                    try:
-                        ordinals.append(int(parts[2]))
-                    except ValueError:
-                        pass
-            next_ordinal = max(ordinals) + 1 if ordinals else 1
-        else:
-            next_ordinal = 1
-        
-        actor_id = f'{prefix}{next_ordinal:04d}'
-        
-        # Create actor
-        actor = Actor(
-            actor_id=actor_id,
-            surname=form.surname.data,
-            given_name=form.given_name.data,
-            middle_name=form.middle_name.data,
-            biographical_info=form.biographical_info.data
+        suffix_start = len(prefix) + 1
+        max_ordinal_query = db.select(
+            db.func.max(db.cast(db.func.substr(Actor.actor_id, suffix_start), db.Integer))
+        ).where(
+            Actor.actor_id.like(f'{prefix}%'),
+            Actor.actor_id.regexp_match(f'^{re.escape(prefix)}[0-9]+$')
         )
         
-        db.session.add(actor)
-        db.session.commit()
+        # The ordinal is read before the insert, so a concurrent create can
+        # take it first; the primary key rejects the duplicate and we re-read
+        for attempt in range(_CREATE_ATTEMPTS):
+            next_ordinal = (db.session.execute(max_ordinal_query).scalar() or 0) + 1
+            actor_id = f'{prefix}{next_ordinal:04d}'
+            
+            # Create actor
+            actor = Actor(
+                actor_id=actor_id,
+                surname=form.surname.data,
+                given_name=form.given_name.data,
+                middle_name=form.middle_name.data,
+                biographical_info=form.biographical_info.data
+            )
+            
+            db.session.add(actor)
+            try:
+                db.session.commit()
+                break
+            except IntegrityError:
+                db.session.rollback()
+                if attempt == _CREATE_ATTEMPTS - 1:
+                    raise
         
         flash(f'Actor {actor.get_display_name()} created with ID {actor_id}', 'success')
         return redirect(url_for('actors.detail', actor_id=actor_id))
@@ -6,7 +6,8 @@ from app.models import (
     Actor, Institution, Position
 )
 from app import db
-from app.routes.helpers import compute_marked_metrics
+from sqlalchemy.orm import joinedload
+from app.routes.helpers import compute_marked_metrics, list_load_options
 
 bp = Blueprint('dashboard', __name__)
 
@@ -17,14 +18,16 @@ def home():
     """Main dashboard - 3-column command center"""
 
     # === CENTER COLUMN: Tracked Scenarios ===
-    my_marked = MarkedScenario.query.filter_by(
+    my_marked = MarkedScenario.query.options(
+        *list_load_options(joinedload(MarkedScenario.scenario))
+    ).filter_by(
         analyst_id=current_user.id
     ).order_by(MarkedScenario.created_at.desc()).all()
 
     my_marked_with_metrics = compute_marked_metrics(my_marked)
 
     # === RIGHT COLUMN: Events Feed (20 most recent) ===
-    recent_events = ControlFrame.query.order_by(
+    recent_events = ControlFrame.query.options(*list_load_options()).order_by(
         ControlFrame.rec_timestamp.desc()
     ).limit(20).all()
 
@@ -2,13 +2,32 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from flask_login import login_required
 from app.models import Article, ControlFrame, ActionCode
 from app.forms import EventCFCreationForm, EventSearchForm
+from app.forms.event_forms import action_code_choices
+from app.routes.helpers import list_load_options
 from app import db
 from app.parser import CIEParser
 from app.cie_highlighter import highlight_cie_syntax
 import json
 
 bp = Blueprint('events', __name__, url_prefix='/events')
-parser = CIEParser()
+_parser = None
+
+# Parse tree token types that name an entity (subject/object of an event)
+_ENTITY_TOKEN_TYPES = frozenset(('POSITION_CODE', 'ACTOR_CODE', 'INSTITUTION_CODE'))
+
+
+def get_parser():
+    """
+    Return the shared CIE parser, building it on first use.
+    
+    Compiling the Lark grammar is the bulk of app start-up time, so it is
+    deferred until the first parse request instead of running at import.
+    """
+    global _parser
+    if _parser is None:
+        _parser = CIEParser()
+    return _parser
+
 
 @bp.route('/')
 @login_required
@@ -17,9 +36,12 @@ def index():
     page = request.args.get('page', 1, type=int)
     per_page = 50
     
-    query = ControlFrame.query
+    query = ControlFrame.query.options(*list_load_options())
     search_form = EventSearchForm(request.args)
     
+    if search_form.search_text.data:
+        query = query.filter(ControlFrame.search_filter(search_form.search_text.data))
+    
     query = query.order_by(ControlFrame.event_code.desc())
     
     events = query.paginate(page=page, per_page=per_page, error_out=False)
@@ -57,20 +79,8 @@ def create_cf_route(article_id=None):
         form.source_article_id.data = article_id
         form.source_article_url.data = article.url
     
-    # Populate action code choices from database
-    action_codes = ActionCode.query.order_by(ActionCode.action_category, ActionCode.action_code).all()
-    
-    # Group action codes by category for better UX
-    grouped_choices = []
-    current_category = None
-    for ac in action_codes:
-        if ac.action_category != current_category:
-            if current_category is not None:
-                grouped_choices.append(('---', '---'))  # Separator
-            current_category = ac.action_category
-        grouped_choices.append((ac.action_code, f"{ac.action_code} - {ac.action_type}"))
-    
-    form.action_code.choices = grouped_choices
+    # Populate action code choices (cached per worker, grouped by category)
+    form.action_code.choices = action_code_choices()
     
     if form.validate_on_submit():
         # Get form data
@@ -195,7 +205,7 @@ def parse_cie_route():
             })
         
         # Parse the CIE body
-        result = parser.parse_safe(cie_body)
+        result = get_parser().parse_safe(cie_body)
         
         if not result['success']:
             return jsonify({
@@ -213,7 +223,7 @@ def parse_cie_route():
             if hasattr(node, 'data'):
                 for child in node.children:
                     if hasattr(child, 'type'):
-                        if child.type in ['POSITION_CODE', 'ACTOR_CODE', 'INSTITUTION_CODE']:
+                        if child.type in _ENTITY_TOKEN_TYPES:
                             if len(subjects) == 0:
                                 subjects.add(child.value)
                             else:
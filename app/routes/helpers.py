@@ -1,7 +1,21 @@
+from flask import current_app
+from sqlalchemy.orm import raiseload
+from app import db
 from app.models import ScenarioEvent
 from app.probability_algorithms import VolatilityCalculator, VelocityCalculator
 
 
+def list_load_options(*options):
+    """Loader options for a list query.
+
+    With RAISELOAD set (development), any relationship not eager-loaded by
+    options raises instead of issuing one lazy SELECT per row.
+    """
+    if current_app.config.get('RAISELOAD'):
+        options += (raiseload('*', sql_only=True),)
+    return options
+
+
 def compute_marked_metrics(marked_scenarios):
     """Compute volatility, velocity, and event count for a list of MarkedScenario objects.
 
@@ -11,9 +25,15 @@ def compute_marked_metrics(marked_scenarios):
     if not marked_scenarios:
         return []
 
-    # Batch-load all ScenarioEvent rows in one query instead of one per scenario
+    # Batch-load all ScenarioEvent rows in one query instead of one per scenario;
+    # only the columns in ix_se_scenario_weight, so no heap fetch is needed
     marked_ids = [m.id for m in marked_scenarios]
-    all_links = ScenarioEvent.query.filter(
+    all_links = db.session.query(
+        ScenarioEvent.marked_scenario_id,
+        ScenarioEvent.event_code,
+        ScenarioEvent.weight,
+        ScenarioEvent.linked_at
+    ).filter(
         ScenarioEvent.marked_scenario_id.in_(marked_ids)
     ).all()
 
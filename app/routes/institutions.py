@@ -3,6 +3,7 @@ from app.models import Institution, Position
 from app.forms import InstitutionForm
 from app import db
 from flask_login import login_required
+from sqlalchemy.orm import selectinload
 
 bp = Blueprint('institutions', __name__, url_prefix='/institutions')
 
@@ -47,7 +48,7 @@ def detail(institution_code):
     # Get all positions in this institution
     positions = Position.query.filter_by(
         institution_code=institution_code
-    ).order_by(Position.position_title).all()
+    ).options(selectinload(Position.current_holder)).order_by(Position.position_title).all()
     
     return render_template('institutions/detail.html',
                          institution=institution,
@@ -113,15 +113,21 @@ def detail(narrative_code):
     """View narrative detail with resolution conditions and linked scenarios"""
     narrative = Narrative.query.get_or_404(narrative_code)
 
-    # Build resolution conditions with occurred status
-    resolution_data = []
-    for resolution in narrative.narrative_resolutions:
-        occurred = ControlFrame.query.filter(
+    # Build resolution conditions with occurred status (one EXISTS per
+    # condition, all in a single query)
+    resolutions = narrative.narrative_resolutions
+    occurred_flags = db.session.execute(db.select(*[
+        db.exists().where(
             ControlFrame.event_actor.ilike(f'%{resolution.entity_code}%'),
             ControlFrame.action_code == resolution.action_code,
             ControlFrame.rec_timestamp < narrative.res_horizon,
-        ).first() is not None
-        resolution_data.append({'resolution': resolution, 'occurred': occurred})
+        )
+        for resolution in resolutions
+    ])).one() if resolutions else ()
+    resolution_data = [
+        {'resolution': resolution, 'occurred': occurred}
+        for resolution, occurred in zip(resolutions, occurred_flags)
+    ]
 
     # Split resolution conditions by polarity, ordered by created_at
     resolution_data_positive = sorted(
@@ -145,15 +151,15 @@ def detail(narrative_code):
 
     # Compute probability metrics for each linked marked scenario
     scenario_metrics = {}
+    cutoff_30, _ = TimeWindowFilter.window_bounds('30day')
     for ns in narrative.narrative_scenarios:
         ms = ns.marked_scenario
         events = [
             (link.event_code, float(link.weight), link.linked_at)
             for link in ms.event_links
         ]
-        filtered = TimeWindowFilter.filter_30day(events)
-        if filtered:
-            vol_result = VolatilityCalculator.calculate(filtered)
+        vol_result = VolatilityCalculator.calculate_windowed(events, cutoff_30)
+        if vol_result['event_count']:
             volatility = vol_result['volatility_score']
             velocity = VelocityCalculator.calculate(volatility, vol_result['event_count'])
         else:
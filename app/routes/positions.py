@@ -1,9 +1,10 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
-from app.models import Position, Institution, Tenure, Actor
+from app.models import Position, Tenure, Actor
 from app.forms import PositionForm, TenureForm
 from app import db
 from datetime import date
 from flask_login import login_required
+from sqlalchemy.orm import joinedload, selectinload
 
 bp = Blueprint('positions', __name__, url_prefix='/positions')
 
@@ -29,7 +30,9 @@ def index():
         )
     
     # Sort by position title
-    query = query.order_by(Position.position_title)
+    query = query.order_by(Position.position_title).options(
+        joinedload(Position.institution), selectinload(Position.current_holder)
+    )
     
     positions = query.paginate(page=page, per_page=per_page, error_out=False)
     
@@ -43,9 +46,9 @@ def detail(position_code):
     position = Position.query.get_or_404(position_code)
     
     # Get all tenures for this position
-    tenures = Tenure.query.filter_by(position_code=position_code).order_by(
-        Tenure.tenure_start.desc()
-    ).all()
+    tenures = Tenure.query.options(joinedload(Tenure.actor)).filter_by(
+        position_code=position_code
+    ).order_by(Tenure.tenure_start.desc()).all()
     
     # Get current holder
     current_holder = position.get_current_holder()
@@ -63,11 +66,7 @@ def create():
     form = PositionForm()
     
     # Populate institution choices
-    institutions = Institution.query.order_by(Institution.institution_name).all()
-    form.institution_code.choices = [
-        (inst.institution_code, f'{inst.institution_code} - {inst.institution_name}')
-        for inst in institutions
-    ]
+    form.populate_choices()
     
     if form.validate_on_submit():
         position = Position(
@@ -96,11 +95,7 @@ def edit(position_code):
     form.edit_mode = True
     
     # Populate institution choices
-    institutions = Institution.query.order_by(Institution.institution_name).all()
-    form.institution_code.choices = [
-        (inst.institution_code, f'{inst.institution_code} - {inst.institution_name}')
-        for inst in institutions
-    ]
+    form.populate_choices()
     
     if form.validate_on_submit():
         position.position_title = form.position_title.data
@@ -138,11 +133,7 @@ def assign_tenure(position_code):
     form = TenureForm()
     
     # Populate actor choices
-    actors = Actor.query.order_by(Actor.surname, Actor.given_name).all()
-    form.actor_id.choices = [
-        (actor.actor_id, f'{actor.actor_id} - {actor.get_display_name()}')
-        for actor in actors
-    ]
+    form.populate_choices(include_positions=False)
     
     # Set position (readonly)
     form.position_code.choices = [(position.position_code, position.position_title)]
@@ -174,19 +165,8 @@ def edit_tenure(tenure_id):
     form = TenureForm(obj=tenure)
     form.tenure_id = tenure_id
     
-    # Populate actor choices
-    actors = Actor.query.order_by(Actor.surname, Actor.given_name).all()
-    form.actor_id.choices = [
-        (actor.actor_id, f'{actor.actor_id} - {actor.get_display_name()}')
-        for actor in actors
-    ]
-    
-    # Populate position choices
-    positions = Position.query.order_by(Position.position_title).all()
-    form.position_code.choices = [
-        (pos.position_code, f'{pos.position_code} - {pos.position_title}')
-        for pos in positions
-    ]
+    # Populate actor and position choices
+    form.populate_choices()
     
     if form.validate_on_submit():
         tenure.actor_id = form.actor_id.data
@@ -3,6 +3,8 @@ from flask_login import login_required, current_user
 from app.models import Scenario, MarkedScenario, ScenarioEvent, ControlFrame, User
 from app import db
 from datetime import datetime
+from sqlalchemy.orm import joinedload
+from app.routes.helpers import compute_marked_metrics, list_load_options
 
 bp = Blueprint('scenarios', __name__, url_prefix='/scenarios')
 
@@ -11,7 +13,6 @@ bp = Blueprint('scenarios', __name__, url_prefix='/scenarios')
 def index():
     """Scenarios index page with 3-column layout"""
     from app.models import Scenario, MarkedScenario, ControlFrame
-    from app.probability_algorithms import VolatilityCalculator, VelocityCalculator, WeightCategory
     
     # Left Column: All available scenarios
     all_scenarios = Scenario.query.order_by(Scenario.created_at.desc()).all()
@@ -24,87 +25,27 @@ def index():
     ]
     
     # Center Column Top: Current user's marked scenarios
-    my_marked = MarkedScenario.query.filter_by(
+    my_marked = MarkedScenario.query.options(
+        *list_load_options(joinedload(MarkedScenario.scenario))
+    ).filter_by(
         analyst_id=current_user.id
     ).order_by(MarkedScenario.created_at.desc()).all()
     
     # Calculate metrics for my marked scenarios
-    my_marked_with_metrics = []
-    for marked in my_marked:
-        # Get linked events for this marked scenario
-        event_links = ScenarioEvent.query.filter_by(
-            marked_scenario_id=marked.id
-        ).all()
-        
-        # Prepare events data
-        events_data = [
-            (link.event_code, float(link.weight), link.linked_at)
-            for link in event_links
-        ]
-        
-        # Calculate metrics
-        if events_data:
-            volatility_result = VolatilityCalculator.calculate(events_data)
-            velocity = VelocityCalculator.calculate(
-                volatility_result['volatility_score'],
-                len(events_data)
-            )
-            volatility = volatility_result['volatility_score']
-        else:
-            velocity = 0.0
-            volatility = 0.0
-        
-        my_marked_with_metrics.append({
-            'marked': marked,
-            'pi': marked.initial_probability,
-            'pc': marked.current_probability,
-            'velocity': velocity,
-            'volatility': volatility,
-            'event_count': len(events_data)
-        })
+    my_marked_with_metrics = compute_marked_metrics(my_marked)
     
     # Center Column Bottom: Other analysts' public marked scenarios
-    public_marked = MarkedScenario.query.filter(
+    public_marked = MarkedScenario.query.options(*list_load_options(
+        joinedload(MarkedScenario.scenario), joinedload(MarkedScenario.analyst)
+    )).filter(
         MarkedScenario.analyst_id != current_user.id
     ).order_by(MarkedScenario.created_at.desc()).all()
     
     # Calculate metrics for public marked scenarios
-    public_marked_with_metrics = []
-    for marked in public_marked:
-        # Get linked events
-        event_links = ScenarioEvent.query.filter_by(
-            marked_scenario_id=marked.id
-        ).all()
-        
-        # Prepare events data
-        events_data = [
-            (link.event_code, float(link.weight), link.linked_at)
-            for link in event_links
-        ]
-        
-        # Calculate metrics
-        if events_data:
-            volatility_result = VolatilityCalculator.calculate(events_data)
-            velocity = VelocityCalculator.calculate(
-                volatility_result['volatility_score'],
-                len(events_data)
-            )
-            volatility = volatility_result['volatility_score']
-        else:
-            velocity = 0.0
-            volatility = 0.0
-        
-        public_marked_with_metrics.append({
-            'marked': marked,
-            'pi': marked.initial_probability,
-            'pc': marked.current_probability,
-            'velocity': velocity,
-            'volatility': volatility,
-            'event_count': len(events_data)
-        })
+    public_marked_with_metrics = compute_marked_metrics(public_marked)
     
     # Right Column: Recent events for reference
-    recent_events = ControlFrame.query.order_by(
+    recent_events = ControlFrame.query.options(*list_load_options()).order_by(
         ControlFrame.rec_timestamp.desc()
     ).limit(100).all()
     
@@ -180,7 +121,7 @@ def detail(scenario_id):
     scenario = Scenario.query.get_or_404(scenario_id)
     
     # Get all marked scenarios for this scenario
-    marked_scenarios = MarkedScenario.query.filter_by(
+    marked_scenarios = MarkedScenario.query.options(joinedload(MarkedScenario.analyst)).filter_by(
         scenario_id=scenario_id
     ).order_by(MarkedScenario.created_at.desc()).all()
     
@@ -459,29 +400,8 @@ def unlink_event(marked_id, event_code):
         return redirect(url_for('scenarios.marked_detail', marked_id=marked_id))
     
     try:
-        # Reverse the probability change
-        previous_prob = float(marked.current_probability)
-        new_prob = previous_prob - float(link.weight)
-        new_prob = max(0.0, min(1.0, new_prob))
-        
-        marked.current_probability = new_prob
-        
-        # Add to history
-        if not marked.probability_history:
-            marked.probability_history = []
-        
-        marked.probability_history.append({
-            'probability': float(new_prob),
-            'timestamp': datetime.utcnow().isoformat(),
-            'reason': f'Event {event_code} unlinked (weight {link.weight} removed)',
-            'event_code': event_code,
-            'user_id': current_user.id
-        })
-        
-        marked.updated_at = datetime.utcnow()
-        
-        # Delete the link
-        db.session.delete(link)
+        # Reverse the probability change and delete the link
+        marked.remove_event(link, current_user.id)
         db.session.commit()
         
         flash(f'Event {event_code} unlinked successfully!', 'success')
@@ -48,21 +48,13 @@ class NewsAPICollector:
             
             logger.info(f"Retrieved {len(articles)} articles from News API")
             
-            articles_added = 0
-            articles_skipped = 0
-            
             with self.app.app_context():
+                rows = []
                 for article_data in articles:
-                    # Check if article already exists (by URL)
                     url = article_data.get('url', '')
                     if not url:
                         continue
                     
-                    existing = Article.query.filter_by(url=url).first()
-                    if existing:
-                        articles_skipped += 1
-                        continue
-                    
                     # Parse published date
                     published_at = article_data.get('published_at', '')
                     try:
@@ -73,20 +65,20 @@ class NewsAPICollector:
                     except:
                         published_date = datetime.utcnow().date()
                     
-                    # Create article
-                    article = Article(
-                        url=url,
-                        headline=article_data.get('title', 'No title')[:250],
-                        summary=article_data.get('description', 'No summary'),
-                        source_name=article_data.get('source', 'Unknown')[:200],
-                        published_date=published_date,
-                        collected_date=datetime.utcnow(),
-                        is_processed=False,
-                        is_junk=False
-                    )
-                    
-                    db.session.add(article)
-                    articles_added += 1
+                    rows.append({
+                        'url': url,
+                        'headline': article_data.get('title', 'No title')[:250],
+                        'summary': article_data.get('description', 'No summary'),
+                        'source_name': article_data.get('source', 'Unknown')[:200],
+                        'published_date': published_date,
+                        'collected_date': datetime.utcnow(),
+                        'is_processed': False,
+                        'is_junk': False
+                    })
+                
+                # Already-stored URLs are skipped by the insert itself
+                articles_added = Article.bulk_load(rows)
+                articles_skipped = len(rows) - articles_added
                 
                 if articles_added > 0:
                     db.session.commit()
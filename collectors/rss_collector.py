@@ -54,21 +54,13 @@ class RSSCollector:
                         logger.warning(f"No entries found in feed: {feed_url}")
                         continue
                     
-                    articles_added = 0
-                    articles_skipped = 0
-                    
+                    rows = []
                     for entry in feed.entries:
                         # Get article URL
                         url = entry.get('link', '')
                         if not url:
                             continue
                         
-                        # Check if article already exists
-                        existing = Article.query.filter_by(url=url).first()
-                        if existing:
-                            articles_skipped += 1
-                            continue
-                        
                         # Parse published date
                         published_date = None
                         if hasattr(entry, 'published_parsed') and entry.published_parsed:
@@ -91,20 +83,20 @@ class RSSCollector:
                         # Get source name from feed title
                         source_name = feed.feed.get('title', 'Unknown RSS Feed')[:200]
                         
-                        # Create article
-                        article = Article(
-                            url=url,
-                            headline=headline,
-                            summary=summary,
-                            source_name=source_name,
-                            published_date=published_date,
-                            collected_date=datetime.utcnow(),
-                            is_processed=False,
-                            is_junk=False
-                        )
-                        
-                        db.session.add(article)
-                        articles_added += 1
+                        rows.append({
+                            'url': url,
+                            'headline': headline,
+                            'summary': summary,
+                            'source_name': source_name,
+                            'published_date': published_date,
+                            'collected_date': datetime.utcnow(),
+                            'is_processed': False,
+                            'is_junk': False
+                        })
+                    
+                    # Already-stored URLs are skipped by the insert itself
+                    articles_added = Article.bulk_load(rows)
+                    articles_skipped = len(rows) - articles_added
                     
                     if articles_added > 0:
                         db.session.commit()
@@ -13,6 +13,13 @@ class Config:
         raise ValueError("DATABASE_URL environment variable is not set!")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+    # Check out only live connections: test each with a cheap ping and
+    # replace any idle longer than the hosting proxy keeps them open.
+    # Pool size stays at the default; a sync gunicorn worker uses one at a time
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_recycle': 300,
+    }
     
     # The News API
     NEWS_API_KEY = os.environ.get('NEWS_API_KEY')
@@ -26,6 +33,9 @@ class Config:
     
     # Application Settings
     ARTICLES_PER_PAGE = int(os.environ.get('ARTICLES_PER_PAGE', '50'))
+    
+    # Make list pages raise on relationships they don't eager-load (N+1 guard)
+    RAISELOAD = False
     TIMEZONE = os.environ.get('TIMEZONE', 'UTC')
     
     # Region codes
@@ -39,6 +49,7 @@ class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
     SQLALCHEMY_ECHO = True
+    RAISELOAD = True
 
 class ProductionConfig(Config):
     """Production configuration"""
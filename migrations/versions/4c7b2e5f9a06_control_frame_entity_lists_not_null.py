@@ -0,0 +1,48 @@
+"""control frame entity lists not null
+
+Revision ID: 4c7b2e5f9a06
+Revises: e6a3c0d84b71
+Create Date: 2026-10-16 16:18:33.090417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '4c7b2e5f9a06'
+down_revision = 'e6a3c0d84b71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Backfill missing lists (SQL NULL or a stored JSON null) before NOT NULL
+    for column in ('identified_subjects', 'identified_objects'):
+        op.execute(
+            f"UPDATE control_frame SET {column} = '[]'::jsonb "
+            f"WHERE {column} IS NULL OR {column} = 'null'::jsonb"
+        )
+
+    with op.batch_alter_table('control_frame', schema=None) as batch_op:
+        batch_op.alter_column('identified_subjects',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               nullable=False,
+               server_default=sa.text("'[]'::jsonb"))
+        batch_op.alter_column('identified_objects',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               nullable=False,
+               server_default=sa.text("'[]'::jsonb"))
+
+
+def downgrade():
+    with op.batch_alter_table('control_frame', schema=None) as batch_op:
+        batch_op.alter_column('identified_objects',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               nullable=True,
+               server_default=None)
+        batch_op.alter_column('identified_subjects',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               nullable=True,
+               server_default=None)
@@ -0,0 +1,30 @@
+"""tenure current and range indexes
+
+Revision ID: 5b2d7e9a4c13
+Revises: c81e4a0d29f7
+Create Date: 2026-10-16 11:03:27.604512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b2d7e9a4c13'
+down_revision = 'c81e4a0d29f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tenures', schema=None) as batch_op:
+        batch_op.create_index('ix_tenure_current_position', ['position_code'], unique=False, postgresql_where=sa.text('tenure_end IS NULL'))
+        batch_op.create_index('ix_tenure_current_actor', ['actor_id'], unique=False, postgresql_where=sa.text('tenure_end IS NULL'))
+        batch_op.create_index('ix_tenure_actor_range', ['actor_id', 'tenure_start', 'tenure_end'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tenures', schema=None) as batch_op:
+        batch_op.drop_index('ix_tenure_actor_range')
+        batch_op.drop_index('ix_tenure_current_actor')
+        batch_op.drop_index('ix_tenure_current_position')
@@ -0,0 +1,26 @@
+"""drop redundant scenario events index
+
+Revision ID: 7d1e9b3f5c20
+Revises: b3f8d1c6e2a7
+Create Date: 2026-10-16 17:48:05.203114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d1e9b3f5c20'
+down_revision = 'b3f8d1c6e2a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('scenario_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_scenario_events_marked_scenario_id')
+
+
+def downgrade():
+    with op.batch_alter_table('scenario_events', schema=None) as batch_op:
+        batch_op.create_index('ix_scenario_events_marked_scenario_id', ['marked_scenario_id'], unique=False)
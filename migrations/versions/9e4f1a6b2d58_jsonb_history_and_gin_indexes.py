@@ -0,0 +1,43 @@
+"""jsonb probability history and control frame gin indexes
+
+Revision ID: 9e4f1a6b2d58
+Revises: 5b2d7e9a4c13
+Create Date: 2026-10-16 14:21:50.318946
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4f1a6b2d58'
+down_revision = '5b2d7e9a4c13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('marked_scenarios', schema=None) as batch_op:
+        batch_op.alter_column('probability_history',
+               existing_type=sa.JSON(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=True,
+               postgresql_using='probability_history::jsonb')
+
+    with op.batch_alter_table('control_frame', schema=None) as batch_op:
+        batch_op.create_index('ix_cf_subjects_gin', ['identified_subjects'], unique=False, postgresql_using='gin', postgresql_ops={'identified_subjects': 'jsonb_path_ops'})
+        batch_op.create_index('ix_cf_objects_gin', ['identified_objects'], unique=False, postgresql_using='gin', postgresql_ops={'identified_objects': 'jsonb_path_ops'})
+
+
+def downgrade():
+    with op.batch_alter_table('control_frame', schema=None) as batch_op:
+        batch_op.drop_index('ix_cf_objects_gin', postgresql_using='gin', postgresql_ops={'identified_objects': 'jsonb_path_ops'})
+        batch_op.drop_index('ix_cf_subjects_gin', postgresql_using='gin', postgresql_ops={'identified_subjects': 'jsonb_path_ops'})
+
+    with op.batch_alter_table('marked_scenarios', schema=None) as batch_op:
+        batch_op.alter_column('probability_history',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.JSON(),
+               existing_nullable=True,
+               postgresql_using='probability_history::json')
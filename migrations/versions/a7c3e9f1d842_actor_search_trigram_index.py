@@ -0,0 +1,28 @@
+"""actor search trigram index
+
+Revision ID: a7c3e9f1d842
+Revises: e2b7f4a9c361
+Create Date: 2026-10-16 18:04:37.904113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e9f1d842'
+down_revision = 'e2b7f4a9c361'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.batch_alter_table('actors', schema=None) as batch_op:
+        batch_op.create_index('ix_actor_search_trgm', [sa.text("(surname || ' ' || given_name || ' ' || actor_id) gin_trgm_ops")], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    # pg_trgm is left installed; other objects may have come to depend on it
+    with op.batch_alter_table('actors', schema=None) as batch_op:
+        batch_op.drop_index('ix_actor_search_trgm', postgresql_using='gin')
@@ -0,0 +1,33 @@
+"""control frame search vector
+
+Revision ID: b3f8d1c6e2a7
+Revises: 4c7b2e5f9a06
+Create Date: 2026-10-16 17:02:41.518236
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f8d1c6e2a7'
+down_revision = '4c7b2e5f9a06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('control_frame', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(
+            "to_tsvector('simple', coalesce(cie_body, '') || ' ' || coalesce(event_actor, '')"
+            " || ' ' || coalesce(identified_subjects::text, '')"
+            " || ' ' || coalesce(identified_objects::text, ''))",
+            persisted=True), nullable=True))
+        batch_op.create_index('ix_cf_search_gin', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    with op.batch_alter_table('control_frame', schema=None) as batch_op:
+        batch_op.drop_index('ix_cf_search_gin', postgresql_using='gin')
+        batch_op.drop_column('search_vector')
@@ -0,0 +1,26 @@
+"""tenure overlap index
+
+Revision ID: c81e4a0d29f7
+Revises: f314f211b873
+Create Date: 2026-10-16 09:12:41.228315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81e4a0d29f7'
+down_revision = 'f314f211b873'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tenures', schema=None) as batch_op:
+        batch_op.create_index('ix_tenure_overlap', ['position_code', 'tenure_start', sa.text("COALESCE(tenure_end, '9999-12-31'::date)")], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tenures', schema=None) as batch_op:
+        batch_op.drop_index('ix_tenure_overlap')
@@ -0,0 +1,26 @@
+"""articles unprocessed index
+
+Revision ID: e2b7f4a9c361
+Revises: 7d1e9b3f5c20
+Create Date: 2026-10-16 17:56:12.418305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b7f4a9c361'
+down_revision = '7d1e9b3f5c20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.create_index('ix_articles_unprocessed', ['published_date'], unique=False, postgresql_where=sa.text('is_processed = false AND is_junk = false'))
+
+
+def downgrade():
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.drop_index('ix_articles_unprocessed')
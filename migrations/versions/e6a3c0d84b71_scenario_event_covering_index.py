@@ -0,0 +1,26 @@
+"""scenario event covering index
+
+Revision ID: e6a3c0d84b71
+Revises: 9e4f1a6b2d58
+Create Date: 2026-10-16 15:40:12.775103
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a3c0d84b71'
+down_revision = '9e4f1a6b2d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('scenario_events', schema=None) as batch_op:
+        batch_op.create_index('ix_se_scenario_weight', ['marked_scenario_id'], unique=False, postgresql_include=['event_code', 'weight', 'linked_at'])
+
+
+def downgrade():
+    with op.batch_alter_table('scenario_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_se_scenario_weight', postgresql_include=['event_code', 'weight', 'linked_at'])
@@ -0,0 +1,35 @@
+"""
+Shared pytest fixtures.
+
+Database tests run against DATABASE_URL (TestingConfig falls back to a local
+global_narratives_test database), which must already be migrated. Each test
+runs inside a transaction that is rolled back afterwards, and database tests
+are skipped when no server can be reached.
+"""
+
+import os
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+# config.py refuses to import without DATABASE_URL
+os.environ.setdefault('DATABASE_URL', 'postgresql://localhost/global_narratives_test')
+
+from app import create_app, db  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    return create_app('testing')
+
+
+@pytest.fixture
+def session(app):
+    """db.session in an app context, rolled back after the test"""
+    with app.app_context():
+        try:
+            db.session.execute(db.text('SELECT 1'))
+        except OperationalError:
+            pytest.skip('test database not available')
+        yield db.session
+        db.session.rollback()
@@ -0,0 +1,100 @@
+"""Model tests: MarkedScenario probability updates"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models import User, Scenario, MarkedScenario, ControlFrame
+
+
+@pytest.fixture
+def make_marked(session):
+    """Factory for marked scenarios of one throwaway analyst and scenario"""
+    tag = uuid.uuid4().hex[:8]
+    analyst = User(username=f'test-{tag}', email=f'test-{tag}@example.com', password_hash='x')
+    session.add(analyst)
+    session.flush()
+    scenario = Scenario(scenario_code=f'test.{tag}', title='Test scenario',
+                        start_date=date(2025, 1, 1), close_date=date(2025, 12, 31),
+                        created_by_id=analyst.id)
+    session.add(scenario)
+    session.flush()
+    
+    def make(current, initial):
+        marked = MarkedScenario(scenario_id=scenario.id, analyst_id=analyst.id,
+                                current_probability=current,
+                                initial_probability=initial,
+                                probability_history=[])
+        session.add(marked)
+        session.flush()
+        return marked
+    
+    make.analyst = analyst
+    make.tag = tag
+    return make
+
+
+def _events(session, tag, count):
+    codes = [f'e.test.{tag}.{i:03d}' for i in range(count)]
+    session.add_all(ControlFrame(event_code=code) for code in codes)
+    session.flush()
+    return codes
+
+
+def _history(session, marked):
+    """Probability history without the per-call timestamps"""
+    session.refresh(marked)
+    return [{k: v for k, v in entry.items() if k != 'timestamp'}
+            for entry in marked.probability_history]
+
+
+@pytest.mark.parametrize('current, initial, weights', [
+    (Decimal('0.500'), Decimal('0.500'), [0.3, -1.2, 4.9, 5.0, -7.9, 0.1]),  # stays inside [0, 1]
+    (Decimal('0.900'), Decimal('0.900'), [12.0, -0.1, 8.0, -4.4]),          # clamps at 1, then moves off it
+    (Decimal('0.100'), Decimal('0.100'), [-12.0, 0.3, -10.9, 2.5]),         # clamps at 0, then restarts from initial
+    (Decimal('0.200'), Decimal('0.650'), [-11.0, 1.5, -6.0, 0.2]),
+    (None, Decimal('0.400'), [2.0, -3.0]),                                  # no current probability yet
+])
+def test_bulk_add_events_matches_sequential_add_event(session, make_marked, current, initial, weights):
+    codes = _events(session, make_marked.tag, len(weights))
+    user_id = make_marked.analyst.id
+    sequential = make_marked(current, initial)
+    bulk = make_marked(current, initial)
+    
+    for code, weight in zip(codes, weights):
+        sequential.add_event(code, weight, user_id)
+    bulk.bulk_add_events([(code, weight, user_id, None) for code, weight in zip(codes, weights)])
+    session.flush()
+    
+    assert _history(session, bulk) == _history(session, sequential)
+    assert bulk.current_probability == sequential.current_probability
+    assert ([(link.event_code, link.weight) for link in bulk.event_links]
+            == [(link.event_code, link.weight) for link in sequential.event_links])
+
+
+@pytest.mark.parametrize('current, initial', [(None, None), (Decimal('0'), None)])
+def test_add_event_without_probability_raises(session, make_marked, current, initial):
+    code, = _events(session, make_marked.tag, 1)
+    marked = make_marked(current, initial)
+    
+    with pytest.raises(ValueError):
+        marked.add_event(code, 2.0, make_marked.analyst.id)
+    with pytest.raises(ValueError):
+        marked.bulk_add_events([(code, 2.0, make_marked.analyst.id, None)])
+
+
+def test_remove_event_without_probability_raises(session, make_marked):
+    code, = _events(session, make_marked.tag, 1)
+    marked = make_marked(Decimal('0.500'), Decimal('0.500'))
+    link = marked.add_event(code, 2.0, make_marked.analyst.id)
+    session.flush()
+    marked.current_probability = None
+    session.flush()
+    
+    with pytest.raises(ValueError):
+        marked.remove_event(link, make_marked.analyst.id)
+    session.refresh(marked)
+    assert marked.current_probability is None
+    assert len(marked.probability_history) == 1
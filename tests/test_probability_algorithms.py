@@ -0,0 +1,24 @@
+"""Probability calculator tests"""
+
+import pytest
+
+from app.probability_algorithms import ProbabilityCalculator
+
+# Every weight a link can carry: -12.0..12.0 in 0.1 steps, excluding 0
+VALID_WEIGHTS = [tenths / 10 for tenths in range(-120, 121) if tenths]
+
+
+def test_calculate_immediate_batch_matches_calculate_immediate():
+    batch = ProbabilityCalculator.calculate_immediate_batch(VALID_WEIGHTS)
+    
+    for i, weight in enumerate(VALID_WEIGHTS):
+        expected = ProbabilityCalculator.calculate_immediate(weight)
+        assert {key: values[i] for key, values in batch.items()} == expected, weight
+
+
+@pytest.mark.parametrize('weight', [0.0, 0.05, -0.05, 4.95, -7.95, 10.95, 12.5, -12.5])
+def test_calculate_immediate_batch_rejects_invalid_weights(weight):
+    with pytest.raises(ValueError):
+        ProbabilityCalculator.calculate_immediate(weight)
+    with pytest.raises(ValueError):
+        ProbabilityCalculator.calculate_immediate_batch([1.0, weight, -3.0])